@@ -99,6 +99,11 @@ AVAILABILITY_MODERATE = 0.60  # 60-80% = moderate discount
 AVAILABILITY_RISKY = 0.40     # 40-60% = heavy discount
 # Below 40% = very heavy discount
 
+# Minimum sample for a player to enter the stats table (applied while
+# parsing Yahoo season stats, before the DataFrame is built)
+STATS_MIN_GP = 5
+STATS_MIN_MINUTES = 15.0  # per game
+
 # Number of days without a game to flag as "inactive"
 INACTIVE_DAYS_THRESHOLD = 10
 
@@ -153,6 +158,16 @@ STAT_CATEGORIES = {
 OUTPUT_DIR = Path("/mnt/c/Users/joshu/projects/nba-fantasy-advisor/outputs")
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+# Local cache for slow-changing Yahoo data (season stats table, etc.).
+# Entries are keyed by day/league and are safe to delete at any time.
+# Set CACHE_ENABLED = False to always fetch fresh data.
+CACHE_ENABLED = True
+CACHE_DIR = PROJECT_DIR / ".cache"
+ROSTER_CACHE_TTL = 60 * 60  # seconds; rosters only change on adds/drops
+LEAGUE_PLAYERS_CACHE_TTL = 60 * 60  # seconds; league player key list
+STATS_BATCH_CACHE_TTL = 6 * 60 * 60  # seconds; per-batch season stat rows
+RECENT_STATS_PROVISIONAL_TTL = 15 * 60  # seconds; per-date lines fetched before that date was final
+
 # Yahoo NBA stat_id → config STAT_CATEGORIES key mapping.
 # Used to validate that your Yahoo league's scoring categories match
 # the 9-cat model this tool expects.  Auto-detected on connection.
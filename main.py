@@ -42,6 +42,7 @@ Examples:
   python main.py --dry-run           Preview add/drop without submitting
   python main.py --faab-history      Show FAAB bid history and suggestions
   python main.py --strategy aggressive  Use aggressive bidding strategy
+  python main.py --no-cache          Fetch fresh rosters/stats (skip local cache)
         """,
     )
     parser.add_argument(
@@ -114,6 +115,11 @@ Examples:
         action="store_true",
         help="Run analysis once and send results via email notification (designed for scheduled/cron use)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore and don't write the local cache (rosters, stats table); always fetch fresh data",
+    )
     parser.add_argument(
         "--notify",
         type=str,
@@ -133,6 +139,8 @@ Examples:
         config.RECENT_GAMES_WINDOW = args.days
     if args.strategy:
         config.FAAB_STRATEGY = args.strategy
+    if args.no_cache:
+        config.CACHE_ENABLED = False
 
     # --dry-run implies --claim
     if args.dry_run:
@@ -284,6 +292,7 @@ Examples:
         skip_yahoo=args.skip_yahoo,
         return_data=need_data,
         compact=args.compact,
+        fresh_rosters=args.claim,
     )
 
     # Unpack the expanded return tuple
@@ -0,0 +1,95 @@
+"""Tiny on-disk cache shared by the Yahoo data fetchers.
+
+Entries are pickled (or JSON-encoded) under ``config.CACHE_DIR`` and written atomically
+(temp file + ``os.replace``) so a crashed run never leaves a truncated
+file behind.  Every helper is best-effort: a missing, stale, or
+unreadable entry is simply a cache miss, and write failures only print
+a warning — caching must never block a run.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import config
+
+
+def cache_path(name: str) -> Path:
+    """Return the on-disk location for cache entry *name*."""
+    return Path(config.CACHE_DIR) / name
+
+
+def load_pickle(name: str, max_age: float | None = None) -> Any | None:
+    """Load a cached object.
+
+    Args:
+        name: Cache entry file name (e.g. ``"stats-94443.pkl"``).
+        max_age: Optional max age in seconds, judged by file mtime.
+
+    Returns:
+        The cached object, or None on a miss (disabled, missing, expired,
+        or unreadable).
+    """
+    if not config.CACHE_ENABLED:
+        return None
+    path = cache_path(name)
+    try:
+        if max_age is not None and time.time() - path.stat().st_mtime > max_age:
+            return None
+        with path.open("rb") as fh:
+            return pickle.load(fh)
+    except Exception:
+        return None
+
+
+def save_pickle(name: str, obj: Any) -> None:
+    """Atomically write *obj* to cache entry *name*."""
+    _write_atomic(name, lambda: pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def load_json(name: str, max_age: float | None = None) -> Any | None:
+    """Load a JSON cache entry; same miss semantics as :func:`load_pickle`."""
+    if not config.CACHE_ENABLED:
+        return None
+    path = cache_path(name)
+    try:
+        if max_age is not None and time.time() - path.stat().st_mtime > max_age:
+            return None
+        with path.open("rb") as fh:
+            return json.load(fh)
+    except Exception:
+        return None
+
+
+def save_json(name: str, obj: Any) -> None:
+    """Atomically write *obj* as JSON to cache entry *name*."""
+    _write_atomic(
+        name,
+        lambda: json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+    )
+
+
+def invalidate(name: str) -> None:
+    """Remove cache entry *name* if it exists."""
+    try:
+        cache_path(name).unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def _write_atomic(name: str, encode: Callable[[], bytes]) -> None:
+    if not config.CACHE_ENABLED:
+        return
+    path = cache_path(name)
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(encode())
+        os.replace(tmp, path)
+    except Exception as exc:
+        print(f"  Warning: could not write cache {path.name}: {exc}")
@@ -23,6 +23,7 @@ from src.yahoo_fantasy import (
     create_yahoo_query,
     extract_player_details,
     get_my_team_roster,
+    invalidate_roster_cache,
     normalize_name,
 )
 from src.faab_analyzer import (
@@ -579,6 +580,7 @@ def submit_transaction(query, xml_payload: str) -> dict[str, Any]:
             response = query.oauth.session.post(url, data=xml_payload, headers=headers)
 
         if response.status_code in (200, 201):
+            invalidate_roster_cache()
             return {
                 "success": True,
                 "message": "Transaction submitted successfully!",
@@ -639,6 +641,7 @@ def submit_roster_move(query, player_key: str, new_position: str) -> dict[str, A
             response = query.oauth.session.put(url, data=xml_payload, headers=headers)
 
         if response.status_code in (200, 201):
+            invalidate_roster_cache()
             return {
                 "success": True,
                 "message": f"Moved {player_key} to {new_position}",
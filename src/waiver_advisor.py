@@ -16,6 +16,7 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
 import pandas as pd
 from tabulate import tabulate
 
@@ -27,18 +28,20 @@ from src.injury_news import (
     get_player_injury_status,
 )
 from src.yahoo_stats import (
-    build_player_stats_table,
     check_recent_activity,
     compute_hot_pickup_scores,
     compute_recent_game_stats,
+    load_player_stats_table,
 )
 from src.yahoo_fantasy import (
+    cancel_prefetched_pages,
     create_yahoo_query,
     extract_player_details,
     extract_player_name,
     get_all_team_rosters,
     get_my_team_roster,
     normalize_name,
+    prefetch_trending_pages,
 )
 
 
@@ -90,6 +93,70 @@ def match_yahoo_to_nba(yahoo_name: str, nba_df: pd.DataFrame) -> int | None:
     return None
 
 
+def _initial_last_key(norm_names: pd.Series) -> pd.Series:
+    """Vectorized "first-initial last-name" key for normalized names.
+
+    Mirrors the partial-match rule used by :func:`match_yahoo_to_nba` and
+    :func:`get_player_injury_status`.  Names with fewer than two parts get
+    an empty key so they never partially match.
+    """
+    parts = norm_names.astype(str).str.split()
+    keys = parts.str[0].str[0] + " " + parts.str[-1]
+    return keys.where(parts.str.len() >= 2, "")
+
+
+def _injured_mask(norm_names: pd.Series, injury_lookup: dict[str, dict]) -> pd.Series:
+    """Boolean mask of players found on the injury report.
+
+    Vectorized equivalent of calling :func:`get_player_injury_status` per
+    row: exact normalized-name hits plus the last-name + first-initial
+    fallback, each resolved with a single ``isin``.
+
+    Args:
+        norm_names: Series of names already passed through ``normalize_name``.
+        injury_lookup: Dict from build_injury_lookup().
+    """
+    if not injury_lookup:
+        return pd.Series(False, index=norm_names.index)
+
+    lookup_keys = pd.Series(list(injury_lookup))
+    partial_keys = set(_initial_last_key(lookup_keys)) - {""}
+
+    exact = norm_names.isin(injury_lookup.keys())
+    partial = _initial_last_key(norm_names).isin(partial_keys)
+    return exact | partial
+
+
+def _match_names_to_positions(names: pd.Series, nba_df: pd.DataFrame) -> pd.Series:
+    """Vectorized :func:`match_yahoo_to_nba` over many names at once.
+
+    Builds the exact-name and first-initial/last-name lookups from
+    *nba_df* once, then resolves every name with two ``Series.map`` calls.
+    The first matching row wins, exactly like the row-by-row scan.
+
+    Returns:
+        Series aligned with *names* holding the matching row *position*
+        in nba_df (float, NaN when unmatched).
+    """
+    if nba_df.empty:
+        return pd.Series(np.nan, index=names.index)
+
+    if "_norm_name" in nba_df.columns:
+        nba_norm = nba_df["_norm_name"].astype(str)
+    else:
+        nba_norm = nba_df["PLAYER_NAME"].map(normalize_name)
+
+    positions = np.arange(len(nba_df))
+    exact = pd.Series(positions, index=nba_norm.to_numpy())
+    exact = exact[~exact.index.duplicated()]
+
+    partial = pd.Series(positions, index=_initial_last_key(nba_norm).to_numpy())
+    partial = partial[(partial.index != "") & ~partial.index.duplicated()]
+
+    norm = names.map(normalize_name)
+    return norm.map(exact).fillna(_initial_last_key(norm).map(partial))
+
+
 def analyze_roster(
     roster_players: list,
     nba_stats: pd.DataFrame,
@@ -103,28 +170,33 @@ def analyze_roster(
     Returns:
         DataFrame summarizing your team's category z-scores.
     """
-    roster_stats = []
-
-    for player_obj in roster_players:
-        details = extract_player_details(player_obj)
-        match_idx = match_yahoo_to_nba(details["name"], nba_stats)
-
-        if match_idx is not None:
-            row = nba_stats.loc[match_idx]
-            player_data = {"name": details["name"], "position": details["position"]}
-            for stat_key in config.STAT_CATEGORIES:
-                z_col = f"Z_{stat_key}"
-                if z_col in row.index:
-                    player_data[z_col] = row[z_col]
-            player_data["Z_TOTAL"] = row.get("Z_TOTAL", 0)
-            roster_stats.append(player_data)
-        else:
-            print(f"  Could not match roster player: {details['name']}")
+    details = [extract_player_details(p) for p in roster_players]
+    if not details:
+        return pd.DataFrame()
+
+    roster = pd.DataFrame({
+        "name": [d["name"] for d in details],
+        "position": [d["position"] for d in details],
+    })
+    match_pos = _match_names_to_positions(roster["name"], nba_stats)
+
+    for name in roster.loc[match_pos.isna(), "name"]:
+        print(f"  Could not match roster player: {name}")
 
-    if not roster_stats:
+    matched = match_pos.notna()
+    if not matched.any():
         return pd.DataFrame()
 
-    roster_df = pd.DataFrame(roster_stats)
+    z_cols = [
+        f"Z_{stat_key}" for stat_key in config.STAT_CATEGORIES
+        if f"Z_{stat_key}" in nba_stats.columns
+    ]
+    rows = nba_stats.iloc[match_pos[matched].astype(int).to_numpy()]
+
+    roster_df = roster[matched].reset_index(drop=True)
+    for z_col in z_cols:
+        roster_df[z_col] = rows[z_col].to_numpy()
+    roster_df["Z_TOTAL"] = rows["Z_TOTAL"].to_numpy() if "Z_TOTAL" in rows.columns else 0
     return roster_df
 
 
@@ -204,13 +276,16 @@ def identify_team_needs(roster_df: pd.DataFrame) -> dict[str, float]:
         Dict mapping category names to average team z-scores, sorted weakest first.
     """
     punt_names = {c.upper() for c in config.PUNT_CATEGORIES}
-    cat_averages = {}
-    for stat_key, cat_info in config.STAT_CATEGORIES.items():
-        if cat_info["name"].upper() in punt_names:
-            continue
-        z_col = f"Z_{stat_key}"
-        if z_col in roster_df.columns:
-            cat_averages[cat_info["name"]] = roster_df[z_col].mean()
+    z_col_to_cat = {
+        f"Z_{stat_key}": cat_info["name"]
+        for stat_key, cat_info in config.STAT_CATEGORIES.items()
+        if cat_info["name"].upper() not in punt_names
+    }
+    z_cols = [c for c in z_col_to_cat if c in roster_df.columns]
+
+    # One column-wise reduction instead of a mean() per category
+    means = roster_df[z_cols].mean(axis=0)
+    cat_averages = {z_col_to_cat[c]: m for c, m in means.items()}
 
     # Sort by z-score ascending (weakest categories first)
     return dict(sorted(cat_averages.items(), key=lambda x: x[1]))
@@ -447,7 +522,6 @@ def score_available_players(
     team_week_data: dict[str, list[tuple[int, float]]] = {}
     team_total_remaining: dict[str, int] = {}  # total games left in tracked weeks
     if schedule_analysis and schedule_analysis.get("weeks"):
-        from src.schedule_analyzer import normalize_team_abbr as _norm
         weeks_data = schedule_analysis["weeks"]
         all_teams: set[str] = set()
         for wk in weeks_data:
@@ -460,52 +534,100 @@ def score_available_players(
         # Also grab pre-computed totals for suspension math
         team_total_remaining = schedule_analysis.get("total_game_counts", {})
 
-    recommendations = []
-
-    for _, row in available_stats.iterrows():
-        player_key = str(row.get("PLAYER_KEY", ""))
-        gp = int(row.get("GP", 0))
-        team_gp = int(row.get("TEAM_GP", gp))
-        avail_rate = row.get("AVAIL_RATE", 1.0)
-        avail_flag = row.get("AVAIL_FLAG", "Unknown")
-        avail_mult = row.get("AVAIL_MULTIPLIER", 1.0)
-
-        rec = {
-            "Player": row.get("PLAYER_NAME", "Unknown"),
-            "Team": row.get("TEAM_ABBREVIATION", ""),
-            "GP": gp,
-            "MIN": round(row.get("MIN", 0), 1),
-            "Avail%": f"{avail_rate:.0%}",
-            "Health": avail_flag,
-        }
+    from src.schedule_analyzer import normalize_team_abbr, compute_schedule_multiplier
+
+    # Pull every column the loop needs out of the DataFrame once
+    # (struct-of-arrays) so the hot path indexes plain NumPy buffers
+    # instead of building a pandas Series per row.
+    n_rows = len(available_stats)
+
+    def _column(col: str, default: Any) -> np.ndarray:
+        if col in available_stats.columns:
+            return available_stats[col].to_numpy()
+        return np.full(n_rows, default, dtype=object)
+
+    player_key_arr = _column("PLAYER_KEY", "")
+    name_arr = _column("PLAYER_NAME", "Unknown")
+    team_arr = _column("TEAM_ABBREVIATION", "")
+    gp_arr = _column("GP", 0)
+    min_arr = _column("MIN", 0)
+    avail_rate_arr = _column("AVAIL_RATE", 1.0)
+    avail_flag_arr = _column("AVAIL_FLAG", "Unknown")
+    avail_mult_arr = _column("AVAIL_MULTIPLIER", 1.0)
+    z_total_arr = _column("Z_TOTAL", 0)
+    stat_arrs = {
+        stat_key: available_stats[stat_key].to_numpy()
+        for stat_key in config.STAT_CATEGORIES
+        if stat_key in available_stats.columns
+    }
+    z_arrs = {
+        z_col: available_stats[z_col].to_numpy()
+        for z_col in cat_name_to_z_col.values()
+        if z_col in available_stats.columns
+    }
+
+    # Output columns are preallocated and filled by position; the final
+    # DataFrame is assembled column-wise (no per-row dicts to re-infer).
+    last_game_out = np.full(n_rows, "-", dtype=object)
+    recent_out = np.full(n_rows, "-", dtype=object)
+    g14_out = np.full(n_rows, "-", dtype=object)
+    injury_out = np.full(n_rows, "-", dtype=object)
+    injury_note_out = np.full(n_rows, "-", dtype=object)
+    is_injured_out = np.zeros(n_rows, dtype=bool)
+    games_wk_out = np.full(n_rows, "-", dtype=object)
+    recent_z_out = np.full(n_rows, "-", dtype=object)
+    z_delta_out = np.full(n_rows, "-", dtype=object)
+    hot_out = np.full(n_rows, "", dtype=object)
+    news_out = np.full(n_rows, "-", dtype=object)
+    own_out = np.full(n_rows, "-", dtype=object)
+    own_delta_out = np.full(n_rows, "-", dtype=object)
+    trending_out = np.full(n_rows, "", dtype=object)
+
+    avail_mult_out = avail_mult_arr.astype(float)
+    injury_mult_out = np.ones(n_rows)
+    need_score_out = z_total_arr.astype(float)
+    schedule_mult_out = np.ones(n_rows)
+    news_mult_out = np.ones(n_rows)
+    recency_boost_out = np.zeros(n_rows)
+    trending_boost_out = np.zeros(n_rows)
+
+    # Compute a need-adjusted score boosting players in weak categories
+    # (team_needs already excludes punted categories)
+    if team_needs:
+        weakest_cats = list(team_needs.keys())[:3]  # top 3 weakest
+        for cat_name in weakest_cats:
+            z_col = cat_name_to_z_col.get(cat_name)
+            if z_col and z_col in z_arrs:
+                need_score_out += z_arrs[z_col] * 0.5  # 50% bonus for weak cats
+
+    for i in range(n_rows):
+        player_key = str(player_key_arr[i])
+        player_name = name_arr[i]
+        avail_mult = avail_mult_out[i]
 
         # Check recent activity if available
         if recent_activity and player_key and player_key in recent_activity:
             activity = recent_activity[player_key]
-            rec["Last Game"] = activity.get("last_game_date", "?") or "?"
-            rec["Recent"] = activity.get("recent_flag", "?")
-            games_14d = activity.get("games_last_14d", 0)
-            rec["G/14d"] = games_14d
+            last_game_out[i] = activity.get("last_game_date", "?") or "?"
+            recent_out[i] = activity.get("recent_flag", "?")
+            g14_out[i] = activity.get("games_last_14d", 0)
 
             # Extra penalty for currently inactive players
             if activity.get("is_inactive"):
                 avail_mult *= 0.3  # Harsh penalty — they're not playing at all
             elif activity.get("recent_flag") == "Questionable":
                 avail_mult *= 0.75  # Moderate penalty — haven't played very recently
-        else:
-            rec["Last Game"] = "-"
-            rec["Recent"] = "-"
-            rec["G/14d"] = "-"
+        avail_mult_out[i] = avail_mult
 
         # Check injury report (overrides game-log heuristics with real news)
-        player_name = row.get("PLAYER_NAME", "Unknown")
         injury_info = None
         injury_mult = 1.0
         if injury_lookup:
             injury_info = get_player_injury_status(player_name, injury_lookup)
         if injury_info:
-            rec["Injury"] = injury_info["severity_label"]
-            rec["Injury_Note"] = format_injury_note(
+            is_injured_out[i] = True
+            injury_out[i] = injury_info["severity_label"]
+            injury_note_out[i] = format_injury_note(
                 injury_info, max_blurb_len=config.INJURY_BLURB_MAX_LENGTH
             )
             injury_mult = injury_info["severity_multiplier"]
@@ -514,9 +636,8 @@ def score_available_players(
             # Sentinel -1.0 means the injury module deferred to us
             # so we can factor in remaining fantasy-season games.
             if injury_mult == -1.0:
-                from src.schedule_analyzer import normalize_team_abbr as _norm_t
                 susp_games = injury_info.get("suspension_games")
-                team_abbr = _norm_t(str(row.get("TEAM_ABBREVIATION", "")))
+                team_abbr = normalize_team_abbr(str(team_arr[i]))
                 remaining = team_total_remaining.get(team_abbr, 0)
 
                 if susp_games is None:
@@ -550,138 +671,136 @@ def score_available_players(
                         injury_mult = 0.60   # moderate miss
                     else:
                         injury_mult = 0.85   # minor miss (1-2 games)
-        else:
-            rec["Injury"] = "-"
-            rec["Injury_Note"] = "-"
-
-        # Add raw stat values for each 9-cat category
-        for stat_key, cat_info in config.STAT_CATEGORIES.items():
-            if stat_key in row.index:
-                val = row[stat_key]
-                if "PCT" in stat_key:
-                    rec[cat_info["name"]] = f"{val:.3f}" if pd.notna(val) else "-"
-                else:
-                    rec[cat_info["name"]] = round(val, 1) if pd.notna(val) else "-"
-
-        # Overall z-score value (raw talent)
-        z_total = row.get("Z_TOTAL", 0)
-        rec["Z_Value"] = round(z_total, 2)
-
-        # Compute a need-adjusted score boosting players in weak categories
-        # (team_needs already excludes punted categories)
-        need_score = z_total
-        if team_needs:
-            weakest_cats = list(team_needs.keys())[:3]  # top 3 weakest
-            for cat_name in weakest_cats:
-                z_col = cat_name_to_z_col.get(cat_name)
-                if z_col and z_col in row.index:
-                    need_score += row[z_col] * 0.5  # 50% bonus for weak cats
+        injury_mult_out[i] = injury_mult
 
         # Schedule multiplier for upcoming games (week-decay weighted)
-        schedule_mult = 1.0
         if schedule_game_counts:
-            from src.schedule_analyzer import normalize_team_abbr, compute_schedule_multiplier
-            team_abbr = normalize_team_abbr(str(row.get("TEAM_ABBREVIATION", "")))
+            team_abbr = normalize_team_abbr(str(team_arr[i]))
             games = schedule_game_counts.get(team_abbr, 0)
 
             # Use multi-week decay-weighted multiplier when available
             week_counts = team_week_data.get(team_abbr)
-            schedule_mult = compute_schedule_multiplier(
+            schedule_mult_out[i] = compute_schedule_multiplier(
                 games, avg_games_per_week, week_game_counts=week_counts,
             )
-            rec["Games_Wk"] = games
-        else:
-            rec["Games_Wk"] = "-"
+            games_wk_out[i] = games
 
         # ---------------------------------------------------------------
         # Hot-pickup boost: recent breakout performance
         # ---------------------------------------------------------------
-        recency_boost = 0.0
-        rec["Recent_Z"] = "-"
-        rec["Z_Delta"] = "-"
-        rec["Hot"] = ""
-
         if hot_pickup_scores and player_key and player_key in hot_pickup_scores:
             hp = hot_pickup_scores[player_key]
-            rec["Recent_Z"] = hp["recent_z_total"]
+            recent_z_out[i] = hp["recent_z_total"]
             z_delta = hp["z_delta"]
-            rec["Z_Delta"] = z_delta
+            z_delta_out[i] = z_delta
             # Boost = weight × z_delta (only positive — don't penalize slumps
             # beyond what the season stats already reflect)
             if z_delta > 0:
-                recency_boost = config.HOT_PICKUP_RECENCY_WEIGHT * z_delta
+                recency_boost_out[i] = config.HOT_PICKUP_RECENCY_WEIGHT * z_delta
             if hp.get("is_hot"):
-                rec["Hot"] = "🔥"
+                hot_out[i] = "🔥"
 
         # ---------------------------------------------------------------
         # Player news multiplier: role/performance signals from ESPN blurbs
         # ---------------------------------------------------------------
-        news_mult = 1.0
-        rec["News"] = "-"
-
         if player_news:
             norm_name = normalize_name(player_name)
             news_info = player_news.get(norm_name)
             if news_info:
-                news_mult = news_info["news_multiplier"]
-                rec["News"] = news_info["news_summary"]
+                news_mult_out[i] = news_info["news_multiplier"]
+                news_out[i] = news_info["news_summary"]
 
         # ---------------------------------------------------------------
         # Trending boost: ownership spike across Yahoo leagues
         # ---------------------------------------------------------------
-        trending_boost = 0.0
-        rec["%Own"] = "-"
-        rec["Δ%Own"] = "-"
-        rec["Trending"] = ""
-
         if trending_data:
             norm_name = normalize_name(player_name)
             trend_info = trending_data.get(norm_name)
             if trend_info:
                 pct = trend_info["percent_owned"]
                 delta = trend_info["percent_owned_delta"]
-                rec["%Own"] = f"{pct:.0f}%"
-                rec["Δ%Own"] = f"{delta:+.0f}%" if delta else "0%"
+                own_out[i] = f"{pct:.0f}%"
+                own_delta_out[i] = f"{delta:+.0f}%" if delta else "0%"
                 if trend_info["is_trending"]:
-                    rec["Trending"] = "📈"
+                    trending_out[i] = "📈"
                     # Trending boost scales with the delta magnitude
                     # A +20% spike is a stronger signal than +5%
-                    trending_boost = (
+                    trending_boost_out[i] = (
                         config.HOT_PICKUP_TRENDING_WEIGHT
                         * min(delta / 10.0, 3.0)  # cap at ~30% delta equivalent
                     )
 
-        # ---------------------------------------------------------------
-        # Apply availability discount, injury penalty, schedule multiplier,
-        # PLUS additive hot-pickup and trending boosts
-        # ---------------------------------------------------------------
-
-        # Hard-skip players who are completely eliminated (OUT-SEASON,
-        # long suspension, etc.) — multiplier of exactly 0.0 means
-        # they won't play again this fantasy season.
-        if injury_mult == 0.0:
-            continue
+    # ---------------------------------------------------------------
+    # Apply availability discount, injury penalty, schedule multiplier,
+    # PLUS additive hot-pickup and trending boosts
+    # ---------------------------------------------------------------
 
-        # For near-eliminated players (extended OUT, long suspension)
-        # zero out additive boosts so they can't be rescued by
-        # trending/recency signals alone.
-        if injury_mult <= 0.05:
-            recency_boost = 0.0
-            trending_boost = 0.0
-
-        adj_score = (
-            need_score * avail_mult * injury_mult * schedule_mult * news_mult
-            + recency_boost
-            + trending_boost
-        )
-        rec["Adj_Score"] = round(adj_score, 2)
+    # For near-eliminated players (extended OUT, long suspension)
+    # zero out additive boosts so they can't be rescued by
+    # trending/recency signals alone.
+    near_eliminated = injury_mult_out <= 0.05
+    recency_boost_out[near_eliminated] = 0.0
+    trending_boost_out[near_eliminated] = 0.0
+
+    adj_score = (
+        need_score_out * avail_mult_out * injury_mult_out * schedule_mult_out * news_mult_out
+        + recency_boost_out
+        + trending_boost_out
+    )
 
-        recommendations.append(rec)
+    # Raw stat values for each 9-cat category
+    stat_display: dict[str, np.ndarray] = {}
+    for stat_key, cat_info in config.STAT_CATEGORIES.items():
+        if stat_key not in stat_arrs:
+            continue
+        vals = stat_arrs[stat_key]
+        missing = pd.isna(vals)
+        if "PCT" in stat_key:
+            shown = np.array([f"{v:.3f}" for v in vals], dtype=object)
+        else:
+            # Counting stats stay float64 unless a "-" placeholder forces
+            # the column to object.
+            shown = np.round(vals.astype(float), 1)
+            if missing.any():
+                shown = shown.astype(object)
+        if missing.any():
+            shown[missing] = "-"
+        stat_display[cat_info["name"]] = shown
+
+    cols: dict[str, np.ndarray] = {
+        "Player": name_arr,
+        "Team": team_arr,
+        "GP": gp_arr.astype(int),
+        "MIN": np.round(min_arr.astype(float), 1),
+        "Avail%": np.array([f"{r:.0%}" for r in avail_rate_arr], dtype=object),
+        "Health": avail_flag_arr,
+        "Last Game": last_game_out,
+        "Recent": recent_out,
+        "G/14d": g14_out,
+        "Injury": injury_out,
+        "Injury_Note": injury_note_out,
+        "Is_Injured": is_injured_out,
+        **stat_display,
+        "Z_Value": np.round(z_total_arr.astype(float), 2),
+        "Games_Wk": games_wk_out,
+        "Recent_Z": recent_z_out,
+        "Z_Delta": z_delta_out,
+        "Hot": hot_out,
+        "News": news_out,
+        "%Own": own_out,
+        "Δ%Own": own_delta_out,
+        "Trending": trending_out,
+        "Adj_Score": np.round(adj_score, 2),
+    }
 
-    if not recommendations:
+    # Hard-skip players who are completely eliminated (OUT-SEASON,
+    # long suspension, etc.) — multiplier of exactly 0.0 means
+    # they won't play again this fantasy season.
+    keep = injury_mult_out != 0.0
+    if not keep.any():
         return pd.DataFrame()
 
-    rec_df = pd.DataFrame(recommendations)
+    rec_df = pd.DataFrame({name: arr[keep] for name, arr in cols.items()})
     rec_df = rec_df.sort_values("Adj_Score", ascending=False).reset_index(drop=True)
     rec_df.index += 1  # 1-based ranking
     rec_df.index.name = "Rank"
@@ -788,9 +907,11 @@ def format_recommendations(
 
     # Show injury notes for any recommended player with an injury
     if "Injury_Note" in rec_df.head(top_n).columns:
-        injured_players = rec_df.head(top_n)[
-            rec_df.head(top_n)["Injury_Note"] != "-"
-        ]
+        top_recs = rec_df.head(top_n)
+        if "Is_Injured" in top_recs.columns:
+            injured_players = top_recs[top_recs["Is_Injured"]]
+        else:
+            injured_players = top_recs[top_recs["Injury_Note"] != "-"]
         if not injured_players.empty:
             lines.append("")
             lines.append(cyan("=" * 100))
@@ -871,8 +992,9 @@ def run_streaming_analysis(return_data: bool = False) -> "pd.DataFrame | None":
     print(f"  {len(all_rosters)} teams, {len(owned_names)} owned players\n")
 
     # ---- Player stats (via Yahoo Fantasy API) ----
-    nba_stats = build_player_stats_table(query)
-    nba_stats["_norm_name"] = nba_stats["PLAYER_NAME"].apply(normalize_name)
+    nba_stats = load_player_stats_table(query)
+    nba_stats["_norm_name"] = nba_stats["PLAYER_NAME"].map(normalize_name).astype("category")
+    owned_names = frozenset(owned_names)
     available_mask = ~nba_stats["_norm_name"].isin(owned_names)
     available_stats = nba_stats[available_mask].copy()
     print(f"  {len(available_stats)} players on waivers\n")
@@ -1096,6 +1218,7 @@ def run_waiver_analysis(
     skip_yahoo: bool = False,
     return_data: bool = False,
     compact: bool = False,
+    fresh_rosters: bool = False,
 ):
     """Run the full waiver wire analysis pipeline.
 
@@ -1110,6 +1233,9 @@ def run_waiver_analysis(
                     roster data (useful for testing without Yahoo API setup).
         return_data: If True, return (query, rec_df) tuple for downstream use
                      (e.g. transaction submission). Only applies when not skipping Yahoo.
+        fresh_rosters: If True, bypass the roster cache so ownership reflects
+                       adds made by other managers since it was written
+                       (set when the results feed a real add/drop).
 
     Returns:
         None normally, or (query, rec_df, nba_stats, schedule_analysis) if return_data=True.
@@ -1126,6 +1252,10 @@ def run_waiver_analysis(
     print("Connecting to Yahoo Fantasy Sports...")
     query = create_yahoo_query()
 
+    # Ownership-trend pages don't depend on anything computed below, so
+    # start them now and let them load alongside rosters and stats.
+    trending_pages = prefetch_trending_pages(query) if config.HOT_PICKUP_ENABLED else None
+
     # ---------------------------------------------------------------
     # STEP 1b: Fetch league settings & constraints
     # ---------------------------------------------------------------
@@ -1153,7 +1283,7 @@ def run_waiver_analysis(
         print(f"  Warning: could not fetch league settings: {e}\n")
 
     print("\nFetching all team rosters in the league...")
-    all_rosters, owned_names = get_all_team_rosters(query)
+    all_rosters, owned_names = get_all_team_rosters(query, force_refresh=fresh_rosters)
     total_owned = len(owned_names)
     print(f"\n  {len(all_rosters)} teams, {total_owned} total owned players\n")
 
@@ -1171,13 +1301,14 @@ def run_waiver_analysis(
     # ---------------------------------------------------------------
     # STEP 2: Fetch NBA stats and compute z-scores
     # ---------------------------------------------------------------
-    nba_stats = build_player_stats_table(query)
+    nba_stats = load_player_stats_table(query)
     print(f"  Loaded stats for {len(nba_stats)} NBA players\n")
 
     # ---------------------------------------------------------------
     # STEP 3: Filter to ONLY available (unowned) players
     # ---------------------------------------------------------------
-    nba_stats["_norm_name"] = nba_stats["PLAYER_NAME"].apply(normalize_name)
+    nba_stats["_norm_name"] = nba_stats["PLAYER_NAME"].map(normalize_name).astype("category")
+    owned_names = frozenset(owned_names)
     available_mask = ~nba_stats["_norm_name"].isin(owned_names)
     available_stats = nba_stats[available_mask].copy()
     owned_stats = nba_stats[~available_mask].copy()
@@ -1229,6 +1360,7 @@ def run_waiver_analysis(
     # Falls back to Yahoo per-date stats only if ESPN fails.
     hot_pickup_scores = None
     espn_boxscores = None  # shared with Step 5b-ii
+    nba_schedule = None  # fetched early by the Yahoo fallback, reused in Step 5c
     if config.HOT_PICKUP_ENABLED and top_candidate_keys:
         try:
             from src.player_news import (
@@ -1267,8 +1399,28 @@ def run_waiver_analysis(
         except Exception as e:
             print(f"  ESPN boxscore fetch failed ({e}), falling back to Yahoo...")
             try:
+                from datetime import date as _date, timedelta
+                from src.schedule_analyzer import (
+                    fetch_nba_schedule, get_team_game_dates, normalize_team_abbr,
+                )
                 hot_keys = top_candidate_keys[: config.DETAILED_LOG_LIMIT]
-                recent_game_stats = compute_recent_game_stats(hot_keys, query)
+                # Only ask Yahoo about dates the player's team actually played
+                # (compute_recent_game_stats looks back up to 21 days).
+                nba_schedule = fetch_nba_schedule()
+                today = _date.today()
+                team_game_dates = get_team_game_dates(
+                    nba_schedule, today - timedelta(days=21), today,
+                )
+                candidates = available_stats.head(candidate_limit)
+                player_teams = dict(zip(
+                    candidates["PLAYER_KEY"].astype(str),
+                    candidates["TEAM_ABBREVIATION"].astype(str).map(normalize_team_abbr),
+                ))
+                recent_game_stats = compute_recent_game_stats(
+                    hot_keys, query,
+                    team_game_dates=team_game_dates,
+                    player_teams=player_teams,
+                )
                 hot_pickup_scores = compute_hot_pickup_scores(recent_game_stats, nba_stats)
                 hot_count = sum(1 for v in hot_pickup_scores.values() if v.get("is_hot"))
                 print(f"  {len(recent_game_stats)} players evaluated via Yahoo, "
@@ -1284,9 +1436,13 @@ def run_waiver_analysis(
         try:
             from src.yahoo_fantasy import fetch_trending_players
             candidate_names = available_stats.head(candidate_limit)["PLAYER_NAME"].tolist()
-            trending_data = fetch_trending_players(query, candidate_names, owned_names)
+            trending_data = fetch_trending_players(
+                query, candidate_names, owned_names, prefetched=trending_pages
+            )
         except Exception as e:
             print(f"  Warning: trending data fetch failed: {e}\n")
+    # Pages the trending step didn't consume (or never got to) are dropped.
+    cancel_prefetched_pages(trending_pages)
 
     # ---------------------------------------------------------------
     # STEP 5b: Fetch injury report from ESPN
@@ -1295,9 +1451,8 @@ def run_waiver_analysis(
     if config.INJURY_REPORT_ENABLED:
         injuries = fetch_injury_report()
         injury_lookup = build_injury_lookup(injuries)
-        injured_available = sum(
-            1 for _, row in available_stats.iterrows()
-            if get_player_injury_status(row["PLAYER_NAME"], injury_lookup)
+        injured_available = int(
+            _injured_mask(available_stats["_norm_name"], injury_lookup).sum()
         )
         print(f"  {len(injuries)} players on injury report, {injured_available} available but injured\n")
 
@@ -1399,7 +1554,7 @@ def run_waiver_analysis(
             fetch_nba_schedule, get_upcoming_weeks, build_schedule_analysis,
             format_schedule_report as fmt_sched,
         )
-        schedule = fetch_nba_schedule()
+        schedule = nba_schedule or fetch_nba_schedule()
         _current_wk = league_settings.get("current_week") if league_settings else None
         weeks = get_upcoming_weeks(current_fantasy_week=_current_wk, game_weeks=game_weeks)
         schedule_analysis = build_schedule_analysis(schedule, weeks)
@@ -1443,7 +1598,10 @@ def run_waiver_analysis(
 
     # Save results
     output_file = config.OUTPUT_DIR / "waiver_recommendations.csv"
-    recommendations.to_csv(output_file)
+    # Is_Injured is an internal display flag; keep the CSV schema unchanged.
+    recommendations.drop(columns="Is_Injured", errors="ignore").to_csv(
+        output_file, encoding="utf-8"
+    )
     print(f"\nResults saved to {output_file}")
 
     if return_data:
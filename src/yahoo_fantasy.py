@@ -6,18 +6,216 @@ all teams' rosters, free agents, and league settings.
 
 import logging
 import os
+import random
+import threading
 import time
 import unicodedata
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from yfpy.query import YahooFantasySportsQuery
 
 import config
+from src.cache import invalidate, load_json, save_json
 
 _AUTH_RETRIES = 3
 _AUTH_BACKOFF = 1.0  # seconds; doubles each retry
+_AUTH_BACKOFF_MAX = 30.0  # cap on a single back-off wait
+_AUTH_JITTER = 0.5  # up to this many seconds added so retries don't line up
 _AUTH_ERROR_PHRASES = ("logged in", "token_expired", "invalid_token", "oauth_problem")
 
+# After every auth retry has failed, further requests on the same query
+# fail fast for this long instead of each walking the full back-off
+# schedule again.
+_AUTH_CIRCUIT_COOLDOWN = 60.0  # seconds
+
+# Serializes token refreshes: when parallel requests all hit an expired
+# token, only the first re-authenticates and the rest retry on its token.
+_AUTH_LOCK = threading.Lock()
+
+# Adaptive request pacing (AIMD) shared by every Yahoo call: a token bucket
+# refilled at up to _RATE_MAX requests/s.  An HTTP 999 halves the rate and
+# pauses every caller (doubling the pause on repeated 999s, up to
+# _RATE_LIMIT_COOLDOWN_MAX); every _RATE_RECOVERY_STREAK successes add
+# _RATE_STEP back.
+_RATE_MAX = 5.0
+_RATE_MIN = 0.5
+_RATE_STEP = 0.5
+_RATE_BUCKET_SIZE = 5.0
+_RATE_RECOVERY_STREAK = 20
+_RATE_LIMIT_COOLDOWN = 15.0  # seconds to pause after a first 999
+_RATE_LIMIT_COOLDOWN_MAX = 60.0
+_RATE_LIMIT_RETRIES = 3
+# yfpy raises "Yahoo data unavailable due to rate limiting" on a 999.
+_RATE_LIMIT_PHRASES = ("rate limit",)
+_RATE_LOCK = threading.Lock()
+_rate_state = {
+    "tokens": _RATE_BUCKET_SIZE,
+    "last": time.monotonic(),
+    "refill": _RATE_MAX,
+    "streak": 0,
+    "paused_until": 0.0,
+}
+
+# Concurrent roster / trending-page fetches — kept small to stay well under
+# Yahoo's rate limit (HTTP 999) while still overlapping network latency.
+_ROSTER_FETCH_WORKERS = 4
+_TRENDING_FETCH_WORKERS = 4
+_LEAGUE_PLAYERS_PAGE_SIZE = 25  # Yahoo returns at most 25 players per call
+_TRENDING_PAGE_SIZE = _LEAGUE_PLAYERS_PAGE_SIZE
+_TRENDING_MAX_FETCHED = 250  # Don't over-fetch — just need the top trending FAs
+# Full league player pool walk (stats table): pages fetched per wave, and a
+# hard stop well above the size of the NBA player pool.
+_LEAGUE_PLAYERS_FETCH_WORKERS = 8
+_LEAGUE_PLAYERS_MAX = 2000
+
+# Background pool for requests started ahead of the step that needs them.
+# Created on first use so runs that never prefetch don't start threads.
+_PREFETCH_POOL: ThreadPoolExecutor | None = None
+_PREFETCH_POOL_LOCK = threading.Lock()
+
+# Connection pool for the Yahoo OAuth session.  Sized to cover the largest
+# set of pools that run at once (recent-stats workers in src.yahoo_stats
+# plus the trending prefetch) so concurrent requests reuse warm keep-alive
+# connections instead of opening a new TLS session each.  Transient 429/5xx
+# responses on idempotent requests are retried at the transport level
+# (honouring Retry-After); the final response is still handed to yfpy
+# unchanged.
+_HTTP_POOL_SIZE = 16
+_HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# League team list is effectively static within a run; cache it per
+# (league_id, game_id) so get_team_name() and friends don't re-list every team.
+_TEAMS_CACHE_TTL = 24 * 60 * 60  # seconds
+_TEAMS_CACHE: dict[tuple[str, str], tuple[float, list[dict]]] = {}
+
+# Sentinel for single-probe getattr() where None is a meaningful value.
+_MISSING = object()
+
+# Punctuation dropped/replaced by normalize_name() in a single pass.
+_NAME_PUNCT_TABLE = str.maketrans({".": "", "'": "", "-": " "})
+
+# Resolved game_id persisted across runs as "{season}:{game_id}".  The
+# season is assumed to roll over in August, ahead of NBA opening night.
+_GAME_ID_CACHE_FILE = Path(config.PROJECT_DIR) / ".yahoo_game_id"
+_SEASON_ROLLOVER_MONTH = 8
+
+# Current-season game info keyed by game code ("nba"); game_id only
+# changes at season boundaries.
+_GAME_INFO_CACHE: dict[str, object] = {}
+
+# yfpy's logger is shared by every thread issuing requests, so muting it is
+# reference-counted: the level is only restored when the last caller exits.
+_QUIET_LOCK = threading.Lock()
+_quiet_depth = 0
+_quiet_prev_level = logging.NOTSET
+
+
+@contextmanager
+def quiet_yfpy_errors():
+    """Silence yfpy's ERROR logs for the duration of the block (thread-safe)."""
+    global _quiet_depth, _quiet_prev_level
+    yfpy_logger = logging.getLogger("yfpy.query")
+    with _QUIET_LOCK:
+        if _quiet_depth == 0:
+            _quiet_prev_level = yfpy_logger.level
+            yfpy_logger.setLevel(logging.CRITICAL)
+        _quiet_depth += 1
+    try:
+        yield
+    finally:
+        with _QUIET_LOCK:
+            _quiet_depth -= 1
+            if _quiet_depth == 0:
+                yfpy_logger.setLevel(_quiet_prev_level)
+
+
+def _ensure_pooled_session(query: YahooFantasySportsQuery) -> None:
+    """Mount a pooled HTTPAdapter on the query's current OAuth session.
+
+    yfpy builds a fresh session whenever it re-authenticates, so this is
+    checked before each request and is a no-op once the session is set up.
+    """
+    session = getattr(getattr(query, "oauth", None), "session", None)
+    if session is None or getattr(session, "_pooled_adapter", False):
+        return
+    adapter = HTTPAdapter(
+        pool_connections=_HTTP_POOL_SIZE,
+        pool_maxsize=_HTTP_POOL_SIZE,
+        max_retries=_HTTP_RETRY,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session._pooled_adapter = True
+
+
+def _acquire_request_token() -> None:
+    """Block until the shared request bucket has a token, then take it."""
+    with _RATE_LOCK:
+        now = time.monotonic()
+        rate = _rate_state["refill"]
+        tokens = min(
+            _RATE_BUCKET_SIZE,
+            _rate_state["tokens"] + (now - _rate_state["last"]) * rate,
+        )
+        _rate_state["last"] = now
+        # Going negative reserves a future slot for this caller.
+        _rate_state["tokens"] = tokens - 1.0
+        wait = (1.0 - tokens) / rate if tokens < 1.0 else 0.0
+    if wait > 0:
+        time.sleep(wait)
+
+
+def _record_request_success() -> None:
+    """Additively raise the request rate after a streak of successes."""
+    with _RATE_LOCK:
+        _rate_state["streak"] += 1
+        if _rate_state["streak"] >= _RATE_RECOVERY_STREAK:
+            _rate_state["refill"] = min(_RATE_MAX, _rate_state["refill"] + _RATE_STEP)
+            _rate_state["streak"] = 0
+
+
+def _record_rate_limited(hits: int) -> float | None:
+    """Cut the request rate and pause the bucket after an HTTP 999.
+
+    Concurrent requests tend to hit the limit together; only the first
+    report starts a pause (and halves the rate), later ones just wait it
+    out.  The pause doubles with each consecutive 999 for the same request.
+
+    Args:
+        hits: How many 999s the calling request has seen so far (1-based).
+
+    Returns:
+        Seconds this caller should wait before retrying, or None if a pause
+        was already in progress (the caller's next token acquire waits).
+    """
+    with _RATE_LOCK:
+        now = time.monotonic()
+        if now < _rate_state["paused_until"]:
+            return None
+        cooldown = min(_RATE_LIMIT_COOLDOWN * (2 ** (hits - 1)), _RATE_LIMIT_COOLDOWN_MAX)
+        cooldown += random.uniform(0, _AUTH_JITTER)
+        _rate_state["refill"] = max(_RATE_MIN, _rate_state["refill"] / 2)
+        _rate_state["tokens"] = 0.0
+        _rate_state["streak"] = 0
+        # Pushing "last" past now makes every acquire in the meantime owe
+        # the remaining pause before its token is granted.
+        _rate_state["paused_until"] = now + cooldown
+        _rate_state["last"] = now + cooldown
+        return cooldown
+
 
 def _patch_get_response(query: YahooFantasySportsQuery) -> None:
     """Patch yfpy's get_response to retry after 401 re-authentication.
@@ -31,41 +229,77 @@ def _patch_get_response(query: YahooFantasySportsQuery) -> None:
     This wrapper:
     1. Suppresses yfpy's ERROR logs during retried attempts so the user
        doesn't see misleading error lines for transient auth failures.
-    2. Forces a fresh ``_authenticate()`` with back-off between retries.
-    3. Re-raises the last exception only if *all* retries fail.
+    2. Forces a fresh ``_authenticate()`` with exponential, jittered
+       back-off between retries; concurrent callers share one refresh.
+    3. Re-raises the last exception only if *all* retries fail, then
+       fails fast on this query (``RuntimeError`` chained to that
+       exception) for ``_AUTH_CIRCUIT_COOLDOWN`` seconds.
+    4. Keeps a pooled connection adapter mounted on the (possibly
+       re-created) OAuth session.
+    5. Paces every request through a shared token bucket, halving its
+       rate and pausing all callers with exponential back-off on Yahoo's
+       HTTP 999 rate-limit response.
     """
     _original = query.get_response
-    _yfpy_logger = logging.getLogger("yfpy.query")
+    # Breaker state is per wrapped query, so one failing session can't
+    # block other leagues or a later create_yahoo_query().
+    circuit: dict = {"open_until": 0.0, "last_exc": None}
 
     def _get_response_with_retry(url: str):
+        if time.monotonic() < circuit["open_until"]:
+            raise RuntimeError("Yahoo auth unavailable") from circuit["last_exc"]
+
         last_exc: Exception | None = None
-        for attempt in range(_AUTH_RETRIES):
+        attempt = 0
+        rate_limit_hits = 0
+        while attempt < _AUTH_RETRIES:
+            _ensure_pooled_session(query)
+            _acquire_request_token()
+            # yfpy replaces ``query.oauth`` on every _authenticate(), so
+            # this identifies the token the request below is sent with.
+            oauth_used = getattr(query, "oauth", None)
             # Suppress yfpy's ERROR logs for the expected "You must be
             # logged in" message that yfpy emits internally *before*
-            # our retry logic can kick in.  We restore the level in the
-            # finally block so normal errors still appear.
-            prev_level = _yfpy_logger.level
-            _yfpy_logger.setLevel(logging.CRITICAL)
+            # our retry logic can kick in.  The level is restored on
+            # exit so normal errors still appear.
             try:
-                result = _original(url)
+                with quiet_yfpy_errors():
+                    result = _original(url)
+                _record_request_success()
                 return result
             except Exception as exc:
                 exc_lower = str(exc).lower()
+                if any(phrase in exc_lower for phrase in _RATE_LIMIT_PHRASES):
+                    if rate_limit_hits >= _RATE_LIMIT_RETRIES:
+                        raise
+                    rate_limit_hits += 1
+                    cooldown = _record_rate_limited(rate_limit_hits)
+                    if cooldown is not None:
+                        print(
+                            f"  Yahoo rate limit hit (HTTP 999) — pausing "
+                            f"{cooldown:.0f}s and slowing requests…"
+                        )
+                    continue
                 if not any(phrase in exc_lower for phrase in _AUTH_ERROR_PHRASES):
-                    # Not an auth error — restore logging and re-raise
-                    _yfpy_logger.setLevel(prev_level)
+                    # Not an auth error — re-raise
                     raise
                 last_exc = exc
-                wait = _AUTH_BACKOFF * (attempt + 1)
+                wait = min(_AUTH_BACKOFF * (2 ** attempt), _AUTH_BACKOFF_MAX)
+                wait += random.uniform(0, _AUTH_JITTER)
                 if attempt == 0:
                     print(
                         f"  Yahoo auth error ({type(exc).__name__}) — refreshing token "
                         f"(retry {attempt + 1}/{_AUTH_RETRIES})…"
                     )
                 time.sleep(wait)
-                query._authenticate()
-            finally:
-                _yfpy_logger.setLevel(prev_level)
+                with _AUTH_LOCK:
+                    # Another thread may have refreshed the token while
+                    # this one waited; if so just retry with it.
+                    if getattr(query, "oauth", None) is oauth_used:
+                        query._authenticate()
+                attempt += 1
+        circuit["open_until"] = time.monotonic() + _AUTH_CIRCUIT_COOLDOWN
+        circuit["last_exc"] = last_exc
         raise last_exc  # type: ignore[misc]
 
     query.get_response = _get_response_with_retry
@@ -76,7 +310,8 @@ def create_yahoo_query() -> YahooFantasySportsQuery:
 
     Uses environment variables for authentication. On first run, a browser
     window will open for OAuth2 authorization.  The Yahoo game_id (which
-    changes every season) is resolved automatically via the API.
+    changes every season) is resolved automatically via the API and cached
+    in ``.yahoo_game_id`` until the season rolls over.
 
     Returns:
         Configured YahooFantasySportsQuery for your NBA fantasy league.
@@ -100,14 +335,68 @@ def create_yahoo_query() -> YahooFantasySportsQuery:
     _patch_get_response(query)
 
     # Auto-resolve game_id for the current season so it never goes stale.
-    game_info = query.get_current_game_info()
-    query.game_id = game_info.game_id
+    game_id = _resolve_game_id(query)
+    query.game_id = game_id
+    # Pin the league key too — otherwise yfpy re-resolves it with a game
+    # metadata request before every league/team query.  (Yahoo's game_key
+    # for the current season is the numeric game_id.)
+    query.league_key = f"{game_id}.l.{config.YAHOO_LEAGUE_ID}"
 
     yfpy_logger.setLevel(prev_level)
 
     return query
 
 
+def _unwrap(obj, attr: str):
+    """Return ``obj.<attr>`` for yfpy wrapper objects, else *obj* itself.
+
+    yfpy sometimes hands back ``{"player": Player}``-style wrappers and
+    sometimes the bare model, depending on the endpoint.
+    """
+    return getattr(obj, attr, obj)
+
+
+def _expected_season(today: date | None = None) -> int:
+    """Return the NBA fantasy season year in progress (season starting in the fall)."""
+    today = today or date.today()
+    return today.year if today.month >= _SEASON_ROLLOVER_MONTH else today.year - 1
+
+
+def _resolve_game_id(query: YahooFantasySportsQuery) -> int:
+    """Return the current season's Yahoo game_id, using the on-disk cache.
+
+    The cache file holds ``{season}:{game_id}`` and is trusted only while
+    its season matches the season in progress; otherwise the game info is
+    fetched and the file rewritten.  The file is neither read nor written
+    when ``config.CACHE_ENABLED`` is False.  Disk errors never block startup.
+    """
+    if config.CACHE_ENABLED:
+        season = _expected_season()
+        try:
+            cached_season, cached_id = _GAME_ID_CACHE_FILE.read_text().strip().split(":", 1)
+            if int(cached_season) == season:
+                return int(cached_id)
+        except (OSError, ValueError):
+            pass
+
+    game_info = _get_current_game_info(query)
+    if config.CACHE_ENABLED:
+        try:
+            _GAME_ID_CACHE_FILE.write_text(f"{game_info.season}:{game_info.game_id}\n")
+        except OSError:
+            pass
+    return game_info.game_id
+
+
+def _get_current_game_info(query: YahooFantasySportsQuery):
+    """Return yfpy's current game info, memoized per game code for the process."""
+    cached = _GAME_INFO_CACHE.get(query.game_code)
+    if cached is None:
+        cached = query.get_current_game_info()
+        _GAME_INFO_CACHE[query.game_code] = cached
+    return cached
+
+
 def list_user_leagues(query: YahooFantasySportsQuery) -> list[dict]:
     """List all fantasy basketball leagues the user belongs to.
 
@@ -120,7 +409,7 @@ def list_user_leagues(query: YahooFantasySportsQuery) -> list[dict]:
     """
     leagues: list[dict] = []
     try:
-        game_info = query.get_current_game_info()
+        game_info = _get_current_game_info(query)
         game_key = str(game_info.game_id)
     except Exception as e:
         print(f"  Error resolving game key: {e}")
@@ -136,14 +425,12 @@ def list_user_leagues(query: YahooFantasySportsQuery) -> list[dict]:
         return leagues
 
     for league_obj in user_leagues:
-        game = league_obj
-        if hasattr(league_obj, "game"):
-            game = league_obj.game
+        game = _unwrap(league_obj, "game")
         league_list = getattr(game, "leagues", None)
         if not league_list:
             continue
         for lg_wrapper in league_list:
-            lg = lg_wrapper.league if hasattr(lg_wrapper, "league") else lg_wrapper
+            lg = _unwrap(lg_wrapper, "league")
             league_key = str(getattr(lg, "league_key", ""))
             lid = league_key.split(".")[-1] if "." in league_key else ""
             leagues.append({
@@ -162,10 +449,17 @@ def list_league_teams(query: YahooFantasySportsQuery) -> list[dict]:
     """List all teams in the current league with their IDs and managers.
 
     Helps new users find their ``YAHOO_TEAM_ID`` without navigating Yahoo.
+    Results are cached per league and game for ``_TEAMS_CACHE_TTL``
+    seconds; failed lookups are not cached.
 
     Returns:
         List of dicts with team_id, name, manager, is_my_team.
     """
+    cache_key = (str(query.league_id), str(query.game_id))
+    cached = _TEAMS_CACHE.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < _TEAMS_CACHE_TTL:
+        return [dict(t) for t in cached[1]]
+
     teams_out: list[dict] = []
     try:
         teams = query.get_league_teams()
@@ -174,7 +468,7 @@ def list_league_teams(query: YahooFantasySportsQuery) -> list[dict]:
         return teams_out
 
     for team_obj in teams:
-        team = team_obj.team if hasattr(team_obj, "team") else team_obj
+        team = _unwrap(team_obj, "team")
         team_id = getattr(team, "team_id", None)
         raw_name = getattr(team, "name", "Unknown")
         name = raw_name.decode("utf-8") if isinstance(raw_name, bytes) else str(raw_name)
@@ -184,7 +478,7 @@ def list_league_teams(query: YahooFantasySportsQuery) -> list[dict]:
         manager_name = ""
         if managers:
             for m_wrapper in managers:
-                mgr = m_wrapper.manager if hasattr(m_wrapper, "manager") else m_wrapper
+                mgr = _unwrap(m_wrapper, "manager")
                 nickname = getattr(mgr, "nickname", "")
                 if nickname:
                     manager_name = str(nickname)
@@ -199,7 +493,8 @@ def list_league_teams(query: YahooFantasySportsQuery) -> list[dict]:
             "is_my_team": is_mine,
         })
 
-    return teams_out
+    _TEAMS_CACHE[cache_key] = (time.monotonic(), teams_out)
+    return [dict(t) for t in teams_out]
 
 
 def get_team_name(query: YahooFantasySportsQuery, team_id: int | None = None) -> str:
@@ -223,25 +518,169 @@ def get_league_teams(query: YahooFantasySportsQuery) -> list:
     return query.get_league_teams()
 
 
-def get_all_team_rosters(query: YahooFantasySportsQuery) -> tuple[dict, set]:
+def _get_rosters_batch(query: YahooFantasySportsQuery, team_ids: list[int]) -> dict[int, list]:
+    """Fetch the rosters of several teams with one ``teams;team_keys=`` request.
+
+    yfpy only wraps the single-team roster endpoint, so this builds the
+    collection URL directly (same player ``out`` fields as
+    ``get_team_roster_player_info_by_date``).
+
+    Returns:
+        Dict mapping team_id -> list of yfpy player objects.
+
+    Raises:
+        ValueError: If the response is missing any requested team's roster.
+    """
+    if not team_ids:
+        return {}
+    league_key = query.get_league_key()
+    team_keys = ",".join(f"{league_key}.t.{tid}" for tid in team_ids)
+    teams = query.query(
+        f"https://fantasysports.yahooapis.com/fantasy/v2/teams;team_keys={team_keys}/"
+        f"roster/players;out=metadata,stats,ownership,percent_owned,draft_analysis",
+        ["teams"],
+    )
+    if not isinstance(teams, list):
+        teams = [teams]
+
+    rosters: dict[int, list] = {}
+    for team_obj in teams:
+        team = _unwrap(team_obj, "team")
+        roster = getattr(team, "roster", None)
+        players = getattr(roster, "players", None)
+        if getattr(team, "team_id", None) is None or players is None:
+            continue
+        if not isinstance(players, list):
+            players = [players]
+        rosters[int(team.team_id)] = players
+
+    missing = [tid for tid in team_ids if tid not in rosters]
+    if missing:
+        raise ValueError(f"no roster returned for team(s) {missing}")
+    return rosters
+
+
+# On-disk roster cache schema (bump the version when the layout changes).
+_ROSTER_CACHE_VERSION = 2
+_ROSTER_FIELDS = (
+    "name", "team", "position", "player_key", "status",
+    "selected_position", "percent_owned", "percent_owned_delta",
+)
+
+
+def _roster_cache_name() -> str:
+    return f"rosters-{config.YAHOO_LEAGUE_ID}.json"
+
+
+def invalidate_roster_cache() -> None:
+    """Drop the on-disk roster cache (call after any add/drop)."""
+    invalidate(_roster_cache_name())
+
+
+def get_all_team_rosters(
+    query: YahooFantasySportsQuery,
+    force_refresh: bool = False,
+) -> tuple[dict, set]:
     """Fetch rosters for every team in the league.
 
-    Iterates through all league teams and pulls each roster so we have
-    a definitive list of which players are owned (and by whom).
+    Rosters only change on adds/drops, so results are cached on disk for
+    ``config.ROSTER_CACHE_TTL`` seconds.  If the live fetch fails, a stale
+    cached copy is returned (with a warning) instead of failing the run.
+
+    Args:
+        query: Authenticated YFPY query instance.
+        force_refresh: Ignore a fresh cache entry and re-fetch from Yahoo.
 
     Returns:
         Tuple of:
           - dict mapping team_name -> list of player detail dicts
           - set of normalized owned player names (for fast lookup)
     """
+    cache_name = _roster_cache_name()
+    if not force_refresh:
+        cached = _decode_roster_cache(load_json(cache_name, max_age=config.ROSTER_CACHE_TTL))
+        if cached is not None:
+            print(f"    Loaded {len(cached[0])} team rosters from cache")
+            return cached
+
+    try:
+        all_rosters, owned_player_names, failed = _fetch_all_team_rosters(query)
+    except Exception as e:
+        stale = _decode_roster_cache(load_json(cache_name))
+        if stale is None:
+            raise
+        print(f"    Warning: roster fetch failed ({e}); using cached rosters")
+        return stale
+
+    # Only a complete league is cached; a partial copy would hide the
+    # missing teams' players as free agents for the whole TTL.
+    if failed:
+        print(f"    Warning: {len(failed)} team roster(s) missing; not caching rosters")
+    elif all_rosters:
+        save_json(cache_name, _encode_roster_cache(all_rosters))
+    return all_rosters, owned_player_names
+
+
+def _encode_roster_cache(all_rosters: dict[str, list[dict]]) -> dict:
+    """Pack rosters column-wise: one list per detail field per team.
+
+    Field names are stored once instead of once per player, which keeps
+    the file small and quick to parse.  The owned-name set is rebuilt
+    from the names on load.
+    """
+    return {
+        "v": _ROSTER_CACHE_VERSION,
+        "ts": time.time(),
+        "fields": list(_ROSTER_FIELDS),
+        "teams": {
+            team_name: {f: [d.get(f) for d in players] for f in _ROSTER_FIELDS}
+            for team_name, players in all_rosters.items()
+        },
+    }
+
+
+def _decode_roster_cache(payload) -> tuple[dict, set] | None:
+    """Inverse of :func:`_encode_roster_cache`.
+
+    Returns None for a miss, an old schema or a corrupt payload, so a bad
+    cache file is never fatal.
+    """
+    if not isinstance(payload, dict) or payload.get("v") != _ROSTER_CACHE_VERSION:
+        return None
+    try:
+        fields = payload["fields"]
+        all_rosters = {
+            team_name: [dict(zip(fields, row)) for row in zip(*(cols[f] for f in fields))]
+            for team_name, cols in payload["teams"].items()
+        }
+        owned = {normalize_name(d["name"]) for players in all_rosters.values() for d in players}
+    except (KeyError, TypeError, ValueError):
+        return None
+    return all_rosters, owned
+
+
+def _fetch_all_team_rosters(query: YahooFantasySportsQuery) -> tuple[dict, set, list[str]]:
+    """Fetch every team's roster live from Yahoo.
+
+    Iterates through all league teams and pulls each roster so we have
+    a definitive list of which players are owned (and by whom).  All
+    rosters are requested in a single multi-team call; if that fails the
+    per-team requests are issued concurrently on a small thread pool.
+    Results are processed in league order either way.
+
+    Returns:
+        Tuple of (rosters by team name, owned player names, names of the
+        teams whose roster could not be fetched).  The rosters are
+        incomplete whenever the last list is non-empty.
+    """
     teams = get_league_teams(query)
     all_rosters: dict[str, list[dict]] = {}
     owned_player_names: set[str] = set()
+    failed: list[str] = []
 
+    team_ids: list[tuple[str, int]] = []
     for team_obj in teams:
-        team = team_obj
-        if hasattr(team_obj, "team"):
-            team = team_obj.team
+        team = _unwrap(team_obj, "team")
 
         team_name = "Unknown"
         team_id = None
@@ -252,21 +691,45 @@ def get_all_team_rosters(query: YahooFantasySportsQuery) -> tuple[dict, set]:
             team_id = int(team.team_id)
 
         if team_id is None:
+            print(f"    Warning: no team ID for {team_name}; skipping its roster")
+            failed.append(team_name)
             continue
+        team_ids.append((team_name, team_id))
+
+    try:
+        batch = _get_rosters_batch(query, [tid for _, tid in team_ids])
+        results = [batch[tid] for _, tid in team_ids]
+    except Exception as e:
+        print(f"    Batch roster fetch failed ({e}); fetching teams individually")
 
+        def _fetch(team_id: int):
+            # Return the exception rather than raising so one failed team
+            # doesn't abort the rest of the batch.
+            try:
+                return query.get_team_roster_player_info_by_date(team_id)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=_ROSTER_FETCH_WORKERS) as pool:
+            results = list(pool.map(_fetch, [tid for _, tid in team_ids]))
+
+    for (team_name, team_id), roster in zip(team_ids, results):
         try:
-            roster = query.get_team_roster_player_info_by_date(team_id)
-            player_details = []
-            for p in roster:
-                details = extract_player_details(p)
-                player_details.append(details)
-                owned_player_names.add(normalize_name(details["name"]))
+            if isinstance(roster, Exception):
+                raise roster
+            player_details = [extract_player_details(p) for p in roster]
+            owned_player_names.update(normalize_name(d["name"]) for d in player_details)
             all_rosters[team_name] = player_details
             print(f"    {team_name}: {len(roster)} players")
         except Exception as e:
             print(f"    Warning: could not fetch roster for {team_name} (ID {team_id}): {e}")
+            failed.append(team_name)
 
-    return all_rosters, owned_player_names
+    # Teams sharing a name would overwrite each other's roster.
+    if not failed and len(all_rosters) < len(teams):
+        failed.append(f"{len(teams) - len(all_rosters)} team(s) with duplicate names")
+
+    return all_rosters, owned_player_names, failed
 
 
 def get_my_team_roster(
@@ -289,34 +752,39 @@ def get_my_team_roster(
     return roster
 
 
+@lru_cache(maxsize=4096)
 def normalize_name(name: str) -> str:
     """Normalize a player name for matching.
 
     Strips diacritics (Dončić → Doncic), punctuation, and casing so that
     names from Yahoo Fantasy and NBA API reliably match even when one source
-    uses Unicode and the other uses ASCII transliterations.
+    uses Unicode and the other uses ASCII transliterations.  Results are
+    memoized — the same few hundred names are normalized over and over.
     """
-    # Decompose Unicode characters and drop combining marks (accents)
-    nfkd = unicodedata.normalize("NFKD", name)
-    ascii_name = "".join(c for c in nfkd if not unicodedata.combining(c))
-    return ascii_name.strip().lower().replace(".", "").replace("'", "").replace("-", " ")
+    if not name.isascii():
+        # Decompose Unicode characters and drop combining marks (accents)
+        nfkd = unicodedata.normalize("NFKD", name)
+        name = "".join(c for c in nfkd if not unicodedata.combining(c))
+    return name.strip().lower().translate(_NAME_PUNCT_TABLE)
 
 
 def extract_player_name(player_obj) -> str:
     """Extract the player's full name from a yfpy player object."""
-    player = player_obj
-    if hasattr(player_obj, "player"):
-        player = player_obj.player
-
-    if hasattr(player, "name"):
-        name = player.name
-        if hasattr(name, "full"):
-            return name.full
-        if hasattr(name, "first") and hasattr(name, "last"):
-            return f"{name.first} {name.last}"
-
-    if hasattr(player, "player_key"):
-        return str(player.player_key)
+    player = _unwrap(player_obj, "player")
+
+    name = getattr(player, "name", _MISSING)
+    if name is not _MISSING:
+        full = getattr(name, "full", _MISSING)
+        if full is not _MISSING:
+            return full
+        first = getattr(name, "first", _MISSING)
+        last = getattr(name, "last", _MISSING)
+        if first is not _MISSING and last is not _MISSING:
+            return f"{first} {last}"
+
+    player_key = getattr(player, "player_key", _MISSING)
+    if player_key is not _MISSING:
+        return str(player_key)
 
     return "Unknown"
 
@@ -324,65 +792,262 @@ def extract_player_name(player_obj) -> str:
 def extract_player_details(player_obj) -> dict:
     """Extract key details from a yfpy player object.
 
+    Each attribute is probed once with ``getattr`` (rather than
+    ``hasattr`` + access) since this runs for every rostered and
+    free-agent player.
+
     Returns:
         Dict with 'name', 'team', 'position', 'player_key', 'status',
-        'percent_owned', 'percent_owned_delta'.
+        'selected_position', 'percent_owned', 'percent_owned_delta',
+        'has_recent_notes'.
     """
-    player = player_obj
-    if hasattr(player_obj, "player"):
-        player = player_obj.player
+    player = _unwrap(player_obj, "player")
 
     details = {
         "name": extract_player_name(player_obj),
-        "team": "",
-        "position": "",
-        "player_key": "",
-        "status": "",
+        "team": str(getattr(player, "editorial_team_abbr", "") or ""),
+        "position": str(getattr(player, "display_position", "") or ""),
+        "player_key": str(getattr(player, "player_key", "") or ""),
+        "status": str(getattr(player, "status", "") or ""),
         "selected_position": "",
         "percent_owned": 0.0,
         "percent_owned_delta": 0.0,
+        "has_recent_notes": bool(getattr(player, "has_recent_player_notes", 0)),
     }
 
-    if hasattr(player, "editorial_team_abbr"):
-        details["team"] = str(player.editorial_team_abbr or "")
-    if hasattr(player, "display_position"):
-        details["position"] = str(player.display_position or "")
-    if hasattr(player, "player_key"):
-        details["player_key"] = str(player.player_key or "")
-    if hasattr(player, "status"):
-        details["status"] = str(player.status or "")
-    if hasattr(player, "selected_position"):
-        sp = player.selected_position
-        if hasattr(sp, "position"):
-            details["selected_position"] = str(sp.position or "")
-        elif hasattr(sp, "selected_position"):
-            inner = sp.selected_position
-            if hasattr(inner, "position"):
-                details["selected_position"] = str(inner.position or "")
-        elif isinstance(sp, dict):
-            details["selected_position"] = str(sp.get("position", ""))
-        elif isinstance(sp, str):
-            details["selected_position"] = sp
-    if hasattr(player, "percent_owned"):
-        po = player.percent_owned
-        if hasattr(po, "value"):
-            details["percent_owned"] = float(po.value or 0)
+    sp = getattr(player, "selected_position", None)
+    if sp is not None:
+        position = getattr(sp, "position", _MISSING)
+        if position is _MISSING:
+            inner = getattr(sp, "selected_position", _MISSING)
+            if inner is not _MISSING:
+                position = getattr(inner, "position", "")
+            elif isinstance(sp, dict):
+                position = sp.get("position", "")
+            elif isinstance(sp, str):
+                position = sp
+            else:
+                position = ""
+        details["selected_position"] = str(position or "")
+
+    po = getattr(player, "percent_owned", None)
+    if po is not None:
+        value = getattr(po, "value", _MISSING)
+        if value is not _MISSING:
+            details["percent_owned"] = float(value or 0)
         elif isinstance(po, (int, float)):
             details["percent_owned"] = float(po)
         # Capture ownership delta (week-over-week change)
-        if hasattr(po, "delta"):
+        delta = getattr(po, "delta", _MISSING)
+        if delta is not _MISSING:
             try:
-                details["percent_owned_delta"] = float(po.delta or 0)
+                details["percent_owned_delta"] = float(delta or 0)
             except (ValueError, TypeError):
                 pass
 
     return details
 
 
+def _merge_yahoo_list(items) -> dict:
+    """Flatten Yahoo's JSON list-of-single-key-dicts into one dict."""
+    if isinstance(items, dict):
+        return items
+    merged: dict = {}
+    for item in items or []:
+        if isinstance(item, dict):
+            merged.update(item)
+    return merged
+
+
+def _parse_league_players_json(payload: dict) -> list[dict]:
+    """Extract player details straight from a league ``players`` JSON payload.
+
+    Pulls only the fields ``extract_player_details`` returns, without
+    building yfpy's model objects for every field of every player.
+
+    Raises:
+        KeyError / TypeError / IndexError on an unexpected payload shape.
+    """
+    league = payload["fantasy_content"]["league"]
+    players = _merge_yahoo_list(league).get("players")
+    if not players:
+        return []
+
+    out = []
+    for idx in range(int(players["count"])):
+        parts = players[str(idx)]["player"]
+        info = _merge_yahoo_list(parts[0])
+        extras = _merge_yahoo_list(parts[1:])
+        po = _merge_yahoo_list(extras.get("percent_owned"))
+
+        name = info.get("name") or {}
+        try:
+            pct = float(po.get("value") or 0)
+        except (ValueError, TypeError):
+            pct = 0.0
+        try:
+            delta = float(po.get("delta") or 0)
+        except (ValueError, TypeError):
+            delta = 0.0
+        out.append({
+            "name": name.get("full") or str(info.get("player_key") or "Unknown"),
+            "team": str(info.get("editorial_team_abbr") or ""),
+            "position": str(info.get("display_position") or ""),
+            "player_key": str(info.get("player_key") or ""),
+            "status": str(info.get("status") or ""),
+            "selected_position": "",
+            "percent_owned": pct,
+            "percent_owned_delta": delta,
+            "has_recent_notes": bool(info.get("has_recent_player_notes")),
+        })
+    return out
+
+
+def _fetch_league_players_page(
+    query: YahooFantasySportsQuery,
+    start: int,
+    count: int,
+    out: str | None = "percent_owned",
+) -> list[dict]:
+    """Fetch one page of league players as detail dicts.
+
+    ``out`` names an extra sub-resource to include (percent owned by
+    default); pass None for just the base player info.  The URL carries
+    no ``format`` parameter: yfpy's ``get_response`` always sends
+    ``format=json``, and a non-JSON body raises here so callers fall back
+    to yfpy's models.
+    """
+    response = query.get_response(_league_players_url(query, start, count, out))
+    return _parse_league_players_json(response.json())
+
+
+def _league_players_url(
+    query: YahooFantasySportsQuery,
+    start: int,
+    count: int,
+    out: str | None,
+) -> str:
+    """URL of one page of the league ``players`` collection."""
+    url = (
+        f"https://fantasysports.yahooapis.com/fantasy/v2/league/{query.get_league_key()}/"
+        f"players;start={start};count={count}"
+    )
+    if out:
+        url += f";out={out}"
+    return url
+
+
+def fetch_all_league_players(query: YahooFantasySportsQuery) -> list[dict]:
+    """Fetch every player in the league's player pool as detail dicts.
+
+    yfpy's ``get_league_players()`` walks the pool 25 players at a time,
+    one request after another, and logs a spurious ERROR when it runs off
+    the end.  Here pages are requested in concurrent waves of
+    ``_LEAGUE_PLAYERS_FETCH_WORKERS``; the first short page ends the walk
+    (overshooting by at most one wave of cheap empty pages).
+
+    A page whose request fails is retried once on its own, keeping the
+    pages already fetched; if the retry fails too, its error is raised.
+    Only an unexpected payload shape falls back to yfpy's pagination.
+
+    Returns:
+        Detail dicts (see :func:`extract_player_details`), one per player,
+        in Yahoo's order.
+    """
+    page = _LEAGUE_PLAYERS_PAGE_SIZE
+    wave = _LEAGUE_PLAYERS_FETCH_WORKERS * page
+
+    def _request(start: int):
+        return query.get_response(_league_players_url(query, start, page, None))
+
+    def _try_request(start: int):
+        """The page's response, or None if the request itself failed."""
+        try:
+            return _request(start)
+        except Exception:
+            return None
+
+    players: list[dict] = []
+    try:
+        with ThreadPoolExecutor(max_workers=_LEAGUE_PLAYERS_FETCH_WORKERS) as pool:
+            for wave_start in range(0, _LEAGUE_PLAYERS_MAX, wave):
+                starts = range(wave_start, wave_start + wave, page)
+                pages = []
+                for start, response in zip(starts, pool.map(_try_request, starts)):
+                    if response is None:
+                        # The request failed; retry just this page, serially.
+                        response = _request(start)
+                    pages.append(_parse_league_players_json(response.json()))
+                for batch in pages:
+                    players.extend(batch)
+                if any(len(batch) < page for batch in pages):
+                    break
+    except (KeyError, TypeError, IndexError, ValueError):
+        # Unexpected payload shape — walk the pool with yfpy's models.
+        with quiet_yfpy_errors():
+            players = [extract_player_details(p) for p in query.get_league_players() or []]
+
+    # Pages can shift if the pool changes mid-walk; keep the first sighting.
+    seen: set[str] = set()
+    unique: list[dict] = []
+    for player in players:
+        key = player["player_key"]
+        if key and key not in seen:
+            seen.add(key)
+            unique.append(player)
+    return unique
+
+
+def _fetch_trending_page(query: YahooFantasySportsQuery, start: int) -> list[dict]:
+    """Fetch one trending page, falling back to yfpy models on a parse error."""
+    try:
+        return _fetch_league_players_page(query, start, _TRENDING_PAGE_SIZE)
+    except Exception:
+        # Unexpected payload shape — fall back to yfpy's model objects.
+        # (yfpy's player_count_limit is an absolute index, not a count.)
+        players = query.get_league_players(
+            player_count_limit=start + _TRENDING_PAGE_SIZE,
+            player_count_start=start,
+        )
+        return [extract_player_details(p) for p in players or []]
+
+
+def prefetch_trending_pages(query: YahooFantasySportsQuery) -> dict[int, Future]:
+    """Start fetching the first trending pages in the background.
+
+    The league player pages don't depend on the waiver candidate list, so
+    they can load while rosters and stats are being fetched.  Pass the
+    result to ``fetch_trending_players(prefetched=...)``.
+
+    Returns:
+        Dict mapping page start index -> Future of that page's detail dicts.
+        Hand it to :func:`cancel_prefetched_pages` if the trending step
+        ends up not running.
+    """
+    global _PREFETCH_POOL
+    with _PREFETCH_POOL_LOCK:
+        if _PREFETCH_POOL is None:
+            _PREFETCH_POOL = ThreadPoolExecutor(
+                max_workers=_TRENDING_FETCH_WORKERS, thread_name_prefix="yahoo-prefetch"
+            )
+        pool = _PREFETCH_POOL
+    return {
+        start: pool.submit(_fetch_trending_page, query, start)
+        for start in range(0, _TRENDING_FETCH_WORKERS * _TRENDING_PAGE_SIZE, _TRENDING_PAGE_SIZE)
+    }
+
+
+def cancel_prefetched_pages(prefetched: dict[int, Future] | None) -> None:
+    """Cancel prefetched trending pages that haven't started yet."""
+    for future in (prefetched or {}).values():
+        future.cancel()
+
+
 def fetch_trending_players(
     query: YahooFantasySportsQuery,
     player_names: list[str],
     owned_names: set[str] | None = None,
+    prefetched: dict[int, Future] | None = None,
 ) -> dict[str, dict]:
     """Fetch percent-owned and ownership delta for waiver candidates.
 
@@ -400,6 +1065,8 @@ def fetch_trending_players(
         query: Authenticated YFPY query instance.
         player_names: List of player names to look up trending data for.
         owned_names: Set of owned player names (to skip).
+        prefetched: Optional page futures from ``prefetch_trending_pages``,
+            used in place of fetching those pages again.
 
     Returns:
         Dict mapping normalized player name → {
@@ -408,52 +1075,69 @@ def fetch_trending_players(
             is_trending: bool,
         }
     """
-    import config
-
     trending: dict[str, dict] = {}
     target_names = {normalize_name(n) for n in player_names}
     if owned_names:
         target_names -= owned_names
 
     if not target_names:
+        cancel_prefetched_pages(prefetched)
         return trending
 
     # Fetch league players in batches to find our candidates
-    # Yahoo returns ~25 players per call; fetch enough to cover free agents
+    # Yahoo returns ~25 players per call; fetch enough to cover free agents.
+    # Pages are requested concurrently but only a worker's worth ahead of
+    # the page being consumed, so once every candidate has been seen no
+    # further requests are issued.
     print("  Fetching Yahoo ownership trends for waiver candidates...")
     seen_names: set[str] = set()
-    batch_size = 25
-    max_fetched = 250  # Don't over-fetch — just need the top trending FAs
+    prefetched = dict(prefetched or {})
+
+    page_starts = iter(range(0, _TRENDING_MAX_FETCHED, _TRENDING_PAGE_SIZE))
+    in_flight: deque = deque()
+
+    with ThreadPoolExecutor(max_workers=_TRENDING_FETCH_WORKERS) as pool:
+        def _top_up() -> None:
+            while len(in_flight) < _TRENDING_FETCH_WORKERS:
+                start = next(page_starts, None)
+                if start is None:
+                    return
+                future = prefetched.pop(start, None)
+                if future is None:
+                    future = pool.submit(_fetch_trending_page, query, start)
+                in_flight.append((start, future))
+
+        _top_up()
+        while in_flight:
+            start, future = in_flight.popleft()
+            try:
+                players = future.result()
+                if not players:
+                    break
 
-    for start in range(0, max_fetched, batch_size):
-        if not target_names - seen_names:
-            break  # Found all candidates
-        try:
-            players = query.get_league_players(
-                player_count_limit=batch_size,
-                player_count_start=start,
-            )
-            if not players:
+                for details in players:
+                    norm = normalize_name(details["name"])
+                    seen_names.add(norm)
+
+                    if norm in target_names:
+                        pct = details.get("percent_owned", 0)
+                        delta = details.get("percent_owned_delta", 0)
+                        is_trending = delta >= config.HOT_PICKUP_MIN_DELTA
+                        trending[norm] = {
+                            "percent_owned": pct,
+                            "percent_owned_delta": delta,
+                            "is_trending": is_trending,
+                        }
+            except Exception as e:
+                print(f"  Warning: trending data batch at {start} failed: {e}")
                 break
-
-            for p_obj in players:
-                details = extract_player_details(p_obj)
-                norm = normalize_name(details["name"])
-                seen_names.add(norm)
-
-                if norm in target_names:
-                    pct = details.get("percent_owned", 0)
-                    delta = details.get("percent_owned_delta", 0)
-                    is_trending = delta >= config.HOT_PICKUP_MIN_DELTA
-                    trending[norm] = {
-                        "percent_owned": pct,
-                        "percent_owned_delta": delta,
-                        "is_trending": is_trending,
-                    }
-            time.sleep(0.3)
-        except Exception as e:
-            print(f"  Warning: trending data batch at {start} failed: {e}")
-            break
+            if not target_names - seen_names:
+                break  # Found all candidates
+            _top_up()
+        # Don't start pages we no longer need
+        for _, future in in_flight:
+            future.cancel()
+        cancel_prefetched_pages(prefetched)
 
     found = len(trending)
     trending_count = sum(1 for v in trending.values() if v["is_trending"])
@@ -5,6 +5,7 @@ scraping needed. ESPN public APIs provide boxscores, injuries, and news.
 
 Public surface (used by waiver_advisor.py):
     build_player_stats_table(query)
+    load_player_stats_table(query)
     check_recent_activity(player_keys, query)
     compute_recent_game_stats(player_keys, query)
     compute_hot_pickup_scores(recent_stats, season_df)
@@ -12,15 +13,18 @@ Public surface (used by waiver_advisor.py):
 
 from __future__ import annotations
 
-import logging
-import time
-from datetime import datetime, timedelta
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from typing import Any
 
+import numpy as np
 import pandas as pd
 from yfpy.query import YahooFantasySportsQuery
 
 import config
+from src.cache import load_pickle, save_pickle
+from src.yahoo_fantasy import fetch_all_league_players
 
 
 # ---------------------------------------------------------------------------
@@ -75,6 +79,32 @@ _REQUIRED_COLS: list[str] = [
     "FG_PCT", "FT_PCT", "FG3M", "PTS", "REB", "AST", "STL", "BLK", "TOV",
 ]
 
+# (stat_id, column, is_counting) for every stat _parse_player_stats emits,
+# resolved once so the per-player loop does no filtering or set lookups.
+_REQUIRED_PAIRS: list[tuple[int, str, bool]] = [
+    (sid, col, sid in _COUNTING_STAT_IDS)
+    for sid, col in _YAHOO_STAT_ID_TO_COL.items()
+    if col in _REQUIRED_COLS
+]
+
+# Stat columns in _parse_player_stats order.
+_STAT_COLS: list[str] = list(dict.fromkeys(col for _, col, _ in _REQUIRED_PAIRS))
+
+# Column layout and declared dtype of the stats table rows (metadata from
+# _extract_player_meta, then stats), so _rows_to_frame never infers one.
+# TEAM_ABBREVIATION stays text until it has been normalised.
+_ROW_DTYPES: dict[str, str] = {
+    "PLAYER_NAME": "str",
+    "PLAYER_KEY": "str",
+    "PLAYER_ID": "int64",
+    "TEAM_ABBREVIATION": "str",
+    "POSITION": "category",
+    "STATUS": "category",
+    "HAS_RECENT_NOTES": "bool",
+    "INJURY_NOTE": "str",
+    **{col: "int64" if col == "GP" else "float64" for col in _STAT_COLS},
+}
+
 # Yahoo NBA team abbreviation mapping.  Yahoo sometimes uses abbreviations
 # that differ from the NBA-official ones.
 _YAHOO_TEAM_ABBR_MAP: dict[str, str] = {
@@ -82,15 +112,49 @@ _YAHOO_TEAM_ABBR_MAP: dict[str, str] = {
     "SA": "SAS", "Uta": "UTA",
 }
 
+# Concurrent stat-batch requests (pacing is enforced by the shared Yahoo
+# request limiter in src.yahoo_fantasy).
+_STATS_FETCH_WORKERS = 4
+
+# Concurrent per-date stat requests in compute_recent_game_stats, and how
+# many days back are scanned per wave before re-checking who still needs games.
+_RECENT_FETCH_WORKERS = 8
+_RECENT_DATE_WAVE = 7
+
+# Low-cardinality text columns stored as pandas categoricals in the stats
+# table (one small integer code per row instead of a Python string).
+_CATEGORY_COLS: tuple[str, ...] = ("TEAM_ABBREVIATION", "POSITION", "STATUS", "AVAIL_FLAG")
+
+# Yahoo player statuses treated as out / questionable by check_recent_activity.
+_INJURED_STATUSES: frozenset[str] = frozenset({"INJ", "O", "SUSP", "NA", "OUT"})
+_QUESTIONABLE_STATUSES: frozenset[str] = frozenset({"DTD", "GTD"})
+
+# (stat_key, volume_col, sign, category name) for hot-pickup scoring,
+# resolved once from config.STAT_CATEGORIES.  Punts are still checked per
+# call since config.PUNT_CATEGORIES may be changed at runtime.
+_HOT_CAT_SPEC: tuple[tuple[str, str | None, float, str], ...] = tuple(
+    (key, info.get("volume_col"), 1.0 if info["higher_is_better"] else -1.0, info["name"].upper())
+    for key, info in config.STAT_CATEGORIES.items()
+)
+
+# AVAIL_FLAG → score multiplier, ordered from least to most available
+# (the order doubles as the pd.cut labels in compute_availability_rate).
+_AVAIL_MULTIPLIERS: dict[str, float] = {
+    "Fragile": 0.45,
+    "Risky": 0.65,
+    "Moderate": 0.85,
+    "Healthy": 1.0,
+}
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-def _normalise_team_abbr(abbr: str) -> str:
-    """Normalise a Yahoo team abbreviation to match schedule data."""
-    upper = abbr.upper().strip()
-    return _YAHOO_TEAM_ABBR_MAP.get(upper, upper)
+def _normalise_team_abbrs(abbrs: pd.Series) -> pd.Series:
+    """Normalise a column of Yahoo team abbreviations to match schedule data."""
+    upper = abbrs.astype(str).str.upper().str.strip()
+    return upper.map(_YAHOO_TEAM_ABBR_MAP).fillna(upper)
 
 
 def _parse_player_stats(player_obj, per_game: bool = True) -> dict[str, Any] | None:
@@ -101,7 +165,9 @@ def _parse_player_stats(player_obj, per_game: bool = True) -> dict[str, Any] | N
         per_game: If True, convert counting stats to per-game by dividing by GP.
 
     Returns:
-        Dict with column names as keys, or None if no stats available.
+        Dict with column names as keys, or None if no stats are available or
+        the player is below ``config.STATS_MIN_GP`` games (or, per-game only,
+        ``config.STATS_MIN_MINUTES`` minutes).
     """
     player = player_obj.player if hasattr(player_obj, "player") else player_obj
 
@@ -124,23 +190,23 @@ def _parse_player_stats(player_obj, per_game: bool = True) -> dict[str, Any] | N
                 pass
 
     gp = raw.get(0, 0)
-    if gp < 1:
-        return None  # no games played — skip
+    if gp < max(1, config.STATS_MIN_GP):
+        return None  # too small a sample — skip before building the row
 
     result: dict[str, Any] = {}
-    for sid, col in _YAHOO_STAT_ID_TO_COL.items():
-        if col not in _REQUIRED_COLS:
-            continue
-        val = raw.get(sid)
+    raw_get = raw.get
+    for sid, col, is_counting in _REQUIRED_PAIRS:
+        val = raw_get(sid)
         if val is None:
             result[col] = 0.0
-            continue
-
-        if per_game and sid in _COUNTING_STAT_IDS and gp > 0:
+        elif per_game and is_counting:
             result[col] = val / gp
         else:
             result[col] = val
 
+    if per_game and result.get("MIN", 0.0) < config.STATS_MIN_MINUTES:
+        return None
+
     # Ensure GP is always the raw total (not divided)
     result["GP"] = int(gp)
 
@@ -162,9 +228,8 @@ def _extract_player_meta(player_obj) -> dict[str, Any]:
         "PLAYER_NAME": full_name,
         "PLAYER_KEY": getattr(player, "player_key", ""),
         "PLAYER_ID": getattr(player, "player_id", 0),
-        "TEAM_ABBREVIATION": _normalise_team_abbr(
-            str(getattr(player, "editorial_team_abbr", "") or "")
-        ),
+        # Raw Yahoo abbreviation; normalised column-wise in build_player_stats_table
+        "TEAM_ABBREVIATION": str(getattr(player, "editorial_team_abbr", "") or ""),
         "POSITION": str(getattr(player, "display_position", "") or ""),
         "STATUS": str(getattr(player, "status", "") or ""),
         "HAS_RECENT_NOTES": bool(getattr(player, "has_recent_player_notes", 0)),
@@ -172,6 +237,27 @@ def _extract_player_meta(player_obj) -> dict[str, Any]:
     }
 
 
+def _rows_to_frame(rows: list[dict[str, Any]]) -> pd.DataFrame:
+    """Build the stats DataFrame column-wise from parsed player rows.
+
+    Every column is built straight into its ``_ROW_DTYPES`` type, so
+    pandas never has to union keys or infer dtypes across hundreds of
+    row dicts.
+    """
+    n = len(rows)
+    columns: dict[str, Any] = {}
+    for col, dtype in _ROW_DTYPES.items():
+        if dtype == "int64":
+            columns[col] = np.fromiter((int(row.get(col) or 0) for row in rows), dtype=np.int64, count=n)
+        elif dtype == "float64":
+            columns[col] = np.fromiter((row[col] for row in rows), dtype=np.float64, count=n)
+        elif dtype == "bool":
+            columns[col] = np.fromiter((bool(row.get(col)) for row in rows), dtype=bool, count=n)
+        else:
+            columns[col] = pd.array([row.get(col) for row in rows], dtype=dtype)
+    return pd.DataFrame(columns)
+
+
 def _batch_fetch_full_stats(
     player_keys: list[str],
     query: YahooFantasySportsQuery,
@@ -193,11 +279,15 @@ def _batch_fetch_full_stats(
     Returns:
         List of dicts, each containing player metadata + per-game stat columns.
     """
-    results: list[dict[str, Any]] = []
-
-    for i in range(0, len(player_keys), batch_size):
-        batch_keys = player_keys[i : i + batch_size]
+    def _fetch_batch(batch_keys: list[str]) -> list[dict[str, Any]] | None:
         keys_param = ",".join(batch_keys)
+        # Season totals move about once a day — reuse a recent parse of
+        # this exact batch instead of re-requesting it.
+        cache_key = f"{keys_param}|{per_game}|{config.STATS_MIN_GP}|{config.STATS_MIN_MINUTES}"
+        cache_name = f"statbatch-{hashlib.sha1(cache_key.encode()).hexdigest()}.pkl"
+        rows = load_pickle(cache_name, max_age=config.STATS_BATCH_CACHE_TTL)
+        if rows is not None:
+            return rows
         try:
             data = query.query(
                 f"https://fantasysports.yahooapis.com/fantasy/v2/players;"
@@ -206,23 +296,105 @@ def _batch_fetch_full_stats(
             )
         except Exception as exc:
             print(f"    Warning: batch stat fetch failed ({len(batch_keys)} players): {exc}")
-            continue
+            return None
 
         if not isinstance(data, list):
             data = [data]
 
+        rows = []
         for item in data:
             meta = _extract_player_meta(item)
             stats = _parse_player_stats(item, per_game=per_game)
             if stats and meta.get("PLAYER_KEY"):
-                row = {**meta, **stats}
-                results.append(row)
+                rows.append({**meta, **stats})
+        save_pickle(cache_name, rows)
+        return rows
+
+    # Batches are independent and network-bound: fetch them concurrently.
+    # Request pacing (and 999 back-off) is handled by the shared limiter in
+    # the patched yfpy get_response, so no per-batch sleep is needed.
+    batches = [player_keys[i : i + batch_size] for i in range(0, len(player_keys), batch_size)]
+    with ThreadPoolExecutor(max_workers=_STATS_FETCH_WORKERS) as pool:
+        responses = list(pool.map(_fetch_batch, batches))
 
-        time.sleep(0.3)  # gentle throttle
+    results: list[dict[str, Any]] = []
+    for rows in responses:
+        if rows:
+            results.extend(rows)
 
     return results
 
 
+def _load_league_player_keys(
+    query: YahooFantasySportsQuery,
+) -> tuple[list[str], dict[str, bool], dict[str, str]]:
+    """Return all league player_keys plus their recent-notes and status flags.
+
+    The key list changes slowly, so it is cached on disk for
+    ``config.LEAGUE_PLAYERS_CACHE_TTL`` seconds.
+
+    Returns:
+        Tuple of (player_keys, notes_lookup, status_lookup) where
+        notes_lookup maps player_key → True for players with recent Yahoo
+        notes and status_lookup maps player_key → Yahoo injury status
+        ("" when healthy).
+    """
+    cache_name = f"league-players-{config.YAHOO_LEAGUE_ID}.pkl"
+    cached = load_pickle(cache_name, max_age=config.LEAGUE_PLAYERS_CACHE_TTL)
+    if isinstance(cached, tuple) and len(cached) == 3:
+        print(f"  Found {len(cached[0])} players in league database (cached)")
+        return cached
+
+    # Pages of the league player pool are fetched concurrently (falling
+    # back to yfpy's serial pagination on an unexpected payload).
+    try:
+        all_players = fetch_all_league_players(query)
+    except Exception as exc:
+        print(f"  ERROR fetching league players: {exc}")
+        all_players = []
+
+    print(f"  Found {len(all_players)} players in league database")
+
+    # Collect player keys and notes flags from league-level data
+    player_keys = [p["player_key"] for p in all_players]
+    notes_lookup: dict[str, bool] = {  # player_key → has_recent_notes
+        p["player_key"]: True for p in all_players if p["has_recent_notes"]
+    }
+    status_lookup: dict[str, str] = {p["player_key"]: p["status"] for p in all_players}
+
+    if player_keys:
+        save_pickle(cache_name, (player_keys, notes_lookup, status_lookup))
+    return player_keys, notes_lookup, status_lookup
+
+
+def _merge_player_flags(
+    df: pd.DataFrame,
+    notes_lookup: dict[str, bool],
+    status_lookup: dict[str, str] | None = None,
+) -> None:
+    """Set HAS_RECENT_NOTES (and STATUS, when given) from league-level data.
+
+    An empty lookup leaves the existing column alone (the league list
+    failed to load), and players missing from *status_lookup* keep their
+    current STATUS.  Mutates *df* in place.
+    """
+    if "PLAYER_KEY" not in df.columns:
+        if "HAS_RECENT_NOTES" not in df.columns:
+            df["HAS_RECENT_NOTES"] = False
+        return
+
+    keys = df["PLAYER_KEY"].astype(str)
+    if notes_lookup:
+        df["HAS_RECENT_NOTES"] = keys.isin(notes_lookup.keys())
+    elif "HAS_RECENT_NOTES" not in df.columns:
+        df["HAS_RECENT_NOTES"] = False
+    if status_lookup:
+        status = keys.map(status_lookup)
+        if "STATUS" in df.columns:
+            status = status.fillna(df["STATUS"].astype(str))
+        df["STATUS"] = status.fillna("").astype("category")
+
+
 # ---------------------------------------------------------------------------
 # Public API — drop-in replacements for nba_stats.py
 # ---------------------------------------------------------------------------
@@ -249,33 +421,7 @@ def build_player_stats_table(query: YahooFantasySportsQuery) -> pd.DataFrame:
     print("Fetching NBA player stats from Yahoo Fantasy API...")
 
     # Phase 1: Fetch ALL league players to collect player_keys.
-    # get_league_players() handles internal pagination (25/request).
-    # yfpy logs an ERROR when pagination ends (normal behavior) — suppress
-    # that misleading noise so only real errors surface.
-    _yfpy_logger = logging.getLogger("yfpy.query")
-    try:
-        _prev_level = _yfpy_logger.level
-        _yfpy_logger.setLevel(logging.CRITICAL)
-        all_players = query.get_league_players()
-    except Exception as exc:
-        print(f"  ERROR fetching league players: {exc}")
-        all_players = []
-    finally:
-        _yfpy_logger.setLevel(_prev_level)
-
-    print(f"  Found {len(all_players)} players in league database")
-
-    # Collect player keys and notes flags from league-level data
-    player_keys: list[str] = []
-    notes_lookup: dict[str, bool] = {}  # player_key → has_recent_notes
-    for p_obj in all_players:
-        player = p_obj.player if hasattr(p_obj, "player") else p_obj
-        pk = getattr(player, "player_key", None)
-        if pk:
-            pk_str = str(pk)
-            player_keys.append(pk_str)
-            if getattr(player, "has_recent_player_notes", 0):
-                notes_lookup[pk_str] = True
+    player_keys, notes_lookup, _ = _load_league_player_keys(query)
 
     if not player_keys:
         print("  ERROR: No player keys found — cannot build stats table")
@@ -284,41 +430,107 @@ def build_player_stats_table(query: YahooFantasySportsQuery) -> pd.DataFrame:
     # Phase 2: Batch-fetch full stats (including GP) via game-level endpoint
     print(f"  Fetching full season stats for {len(player_keys)} players...")
     rows = _batch_fetch_full_stats(player_keys, query, per_game=True)
-    print(f"  Got stats for {len(rows)} players with games played")
+    print(
+        f"  Got stats for {len(rows)} players "
+        f"(≥{config.STATS_MIN_GP} GP, ≥{config.STATS_MIN_MINUTES:g} MIN)"
+    )
 
     if not rows:
         return pd.DataFrame()
 
-    df = pd.DataFrame(rows)
+    df = _rows_to_frame(rows)
+    df["TEAM_ABBREVIATION"] = _normalise_team_abbrs(df["TEAM_ABBREVIATION"])
 
     # Merge Yahoo player-notes flags from Phase 1 (league-level data)
-    if "PLAYER_KEY" in df.columns and notes_lookup:
-        df["HAS_RECENT_NOTES"] = df["PLAYER_KEY"].map(
-            lambda pk: notes_lookup.get(str(pk), False)
-        )
-    elif "HAS_RECENT_NOTES" not in df.columns:
-        df["HAS_RECENT_NOTES"] = False
-
-    # Filter to meaningful players (≥ 5 GP and ≥ 15 MIN per game)
-    df = df[df["GP"] >= 5].copy()
-    df = df[df["MIN"] >= 15.0].copy()
-    print(f"  {len(df)} players after filtering (≥5 GP, ≥15 MIN)")
+    _merge_player_flags(df, notes_lookup)
 
-    # Phase 3: Compute 9-category z-scores
-    df = compute_9cat_z_scores(df)
+    # Phase 3: Compute 9-category z-scores (df is local — no defensive copies)
+    compute_9cat_z_scores(df, inplace=True)
 
     # Phase 4: Compute availability rate
-    df = compute_availability_rate(df)
+    compute_availability_rate(df, inplace=True)
+
+    for col in _CATEGORY_COLS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
 
     df = df.sort_values("Z_TOTAL", ascending=False).reset_index(drop=True)
     return df
 
 
+# In-process copy of today's stats table, keyed like the disk cache entry.
+_STATS_TABLE_CACHE: dict[str, pd.DataFrame] = {}
+
+
+def load_player_stats_table(
+    query: YahooFantasySportsQuery,
+    refresh: bool = False,
+) -> pd.DataFrame:
+    """Return today's player stats table, reusing a cached build when possible.
+
+    Season stats only move once a day, so the full
+    :func:`build_player_stats_table` pipeline (hundreds of Yahoo calls)
+    is memoized in-process and pickled to ``config.CACHE_DIR`` keyed on
+    the league, the current date, the punt configuration (which changes
+    ``Z_TOTAL``), the GP/MIN sample filter (which changes the rows) and
+    the availability cut-offs (which change ``AVAIL_FLAG``).  Disabled
+    when ``config.CACHE_ENABLED`` is False.
+
+    Injury designations and player notes change during the day, so on a
+    cache hit ``STATUS`` and ``HAS_RECENT_NOTES`` are re-merged from the
+    league player list.  That list is cached for
+    ``config.LEAGUE_PLAYERS_CACHE_TTL`` seconds; once it has expired, a
+    "hit" still walks the whole league player pool (a few dozen paged
+    requests), though it skips the season-stat batches.
+
+    Args:
+        query: Authenticated yfpy query instance.
+        refresh: Ignore any cached copy and rebuild from Yahoo.
+
+    Returns:
+        A fresh copy of the stats table — callers may add columns freely.
+    """
+    punts = ",".join(sorted(c.upper() for c in config.PUNT_CATEGORIES))
+    key = "|".join(str(part) for part in (
+        config.YAHOO_LEAGUE_ID,
+        date.today().isoformat(),
+        punts,
+        config.STATS_MIN_GP,
+        config.STATS_MIN_MINUTES,
+        config.AVAILABILITY_HEALTHY,
+        config.AVAILABILITY_MODERATE,
+        config.AVAILABILITY_RISKY,
+    ))
+    file_name = f"stats-{config.YAHOO_LEAGUE_ID}.pkl"
+
+    df: pd.DataFrame | None = None
+    if config.CACHE_ENABLED and not refresh:
+        df = _STATS_TABLE_CACHE.get(key)
+        if df is None:
+            cached = load_pickle(file_name)
+            if isinstance(cached, dict) and cached.get("key") == key:
+                df = cached["df"]
+                print(f"Loaded NBA player stats from cache ({len(df)} players)")
+
+    if df is not None:
+        _, notes_lookup, status_lookup = _load_league_player_keys(query)
+        df = df.copy()
+        _merge_player_flags(df, notes_lookup, status_lookup)
+    else:
+        df = build_player_stats_table(query)
+        if not df.empty:
+            save_pickle(file_name, {"key": key, "df": df})
+
+    if config.CACHE_ENABLED and not df.empty:
+        _STATS_TABLE_CACHE[key] = df
+    return df.copy()
+
+
 # ---------------------------------------------------------------------------
 # Z-score computation
 # ---------------------------------------------------------------------------
 
-def compute_9cat_z_scores(df: pd.DataFrame) -> pd.DataFrame:
+def compute_9cat_z_scores(df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
     """Compute z-scores for each 9-category stat and an overall value.
 
     For counting stats, uses standard z-scores.  For percentage stats
@@ -327,13 +539,35 @@ def compute_9cat_z_scores(df: pd.DataFrame) -> pd.DataFrame:
 
     Categories listed in ``config.PUNT_CATEGORIES`` are excluded from
     ``Z_TOTAL`` but their individual z-columns are still computed.
+
+    Pass ``inplace=True`` when the caller owns *df* to add the columns
+    without copying the frame first.
     """
-    df = df.copy()
+    if not inplace:
+        df = df.copy()
 
     punt_names = {c.upper() for c in config.PUNT_CATEGORIES}
-    z_columns: list[str] = []
+    z_scores: dict[str, np.ndarray] = {}
     z_columns_for_total: list[str] = []
 
+    # Counting stats: cast every column to float once and z-score them all
+    # in a single broadcast instead of one Series round-trip per category.
+    counting = [
+        k for k, info in config.STAT_CATEGORIES.items()
+        if k in df.columns and not (info.get("volume_col") and info["volume_col"] in df.columns)
+    ]
+    counting_z: dict[str, np.ndarray] = {}
+    if counting:
+        mat = df[counting].to_numpy(dtype=np.float64)
+        means = np.nanmean(mat, axis=0)
+        stds = np.nanstd(mat, axis=0, ddof=1)
+        signs = np.array(
+            [1.0 if config.STAT_CATEGORIES[k]["higher_is_better"] else -1.0 for k in counting]
+        )
+        z_mat = (mat - means) / np.where(stds == 0, 1.0, stds) * signs
+        z_mat[:, stds == 0] = 0.0
+        counting_z = dict(zip(counting, z_mat.T))
+
     for stat_key, cat_info in config.STAT_CATEGORIES.items():
         if stat_key not in df.columns:
             continue
@@ -341,42 +575,30 @@ def compute_9cat_z_scores(df: pd.DataFrame) -> pd.DataFrame:
         z_col = f"Z_{stat_key}"
         volume_col = cat_info.get("volume_col")
 
-        if volume_col and volume_col in df.columns:
+        if stat_key in counting_z:
+            z_scores[z_col] = counting_z[stat_key]
+        else:
             # Volume-weighted impact z-score (FG%, FT%)
-            pct = df[stat_key].astype(float)
-            vol = df[volume_col].astype(float)
-            league_avg_pct = pct.mean()
-
-            impact = vol * (pct - league_avg_pct)
-            imp_mean = impact.mean()
-            imp_std = impact.std()
+            pct = df[stat_key].to_numpy(dtype=np.float64)
+            vol = df[volume_col].to_numpy(dtype=np.float64)
+            impact = vol * (pct - np.nanmean(pct))
+            imp_mean = np.nanmean(impact)
+            imp_std = np.nanstd(impact, ddof=1)
 
             if imp_std == 0:
-                df[z_col] = 0.0
+                z_scores[z_col] = np.zeros(len(df))
             else:
                 z = (impact - imp_mean) / imp_std
                 if not cat_info["higher_is_better"]:
                     z = -z
-                df[z_col] = z
-        else:
-            # Standard z-score (counting stats)
-            col = df[stat_key].astype(float)
-            mean = col.mean()
-            std = col.std()
-
-            if std == 0:
-                df[z_col] = 0.0
-            else:
-                z = (col - mean) / std
-                if not cat_info["higher_is_better"]:
-                    z = -z
-                df[z_col] = z
-
-        z_columns.append(z_col)
+                z_scores[z_col] = z
 
         if cat_info["name"].upper() not in punt_names:
             z_columns_for_total.append(z_col)
 
+    for z_col, z in z_scores.items():
+        df[z_col] = z
+
     df["Z_TOTAL"] = df[z_columns_for_total].sum(axis=1) if z_columns_for_total else 0.0
     return df
 
@@ -385,12 +607,18 @@ def compute_9cat_z_scores(df: pd.DataFrame) -> pd.DataFrame:
 # Availability rate computation
 # ---------------------------------------------------------------------------
 
-def compute_availability_rate(df: pd.DataFrame, team_gp: int | None = None) -> pd.DataFrame:
+def compute_availability_rate(
+    df: pd.DataFrame,
+    team_gp: int | None = None,
+    inplace: bool = False,
+) -> pd.DataFrame:
     """Add availability rate and health flags to a player stats DataFrame.
 
     Columns added: TEAM_GP, AVAIL_RATE, AVAIL_FLAG, AVAIL_MULTIPLIER.
+    Pass ``inplace=True`` when the caller owns *df* to skip the copy.
     """
-    df = df.copy()
+    if not inplace:
+        df = df.copy()
 
     if team_gp is None:
         team_gp = int(df["GP"].max())
@@ -398,26 +626,18 @@ def compute_availability_rate(df: pd.DataFrame, team_gp: int | None = None) -> p
     df["TEAM_GP"] = team_gp
     df["AVAIL_RATE"] = (df["GP"] / team_gp).clip(0, 1)
 
-    def _flag(rate: float) -> str:
-        if rate >= config.AVAILABILITY_HEALTHY:
-            return "Healthy"
-        elif rate >= config.AVAILABILITY_MODERATE:
-            return "Moderate"
-        elif rate >= config.AVAILABILITY_RISKY:
-            return "Risky"
-        return "Fragile"
-
-    def _multiplier(rate: float) -> float:
-        if rate >= config.AVAILABILITY_HEALTHY:
-            return 1.0
-        elif rate >= config.AVAILABILITY_MODERATE:
-            return 0.85
-        elif rate >= config.AVAILABILITY_RISKY:
-            return 0.65
-        return 0.45
-
-    df["AVAIL_FLAG"] = df["AVAIL_RATE"].apply(_flag)
-    df["AVAIL_MULTIPLIER"] = df["AVAIL_RATE"].apply(_multiplier)
+    # Bucket in one pass: [0, RISKY) Fragile, [RISKY, MODERATE) Risky,
+    # [MODERATE, HEALTHY) Moderate, [HEALTHY, 1] Healthy.
+    bins = [
+        -np.inf,
+        config.AVAILABILITY_RISKY,
+        config.AVAILABILITY_MODERATE,
+        config.AVAILABILITY_HEALTHY,
+        np.inf,
+    ]
+    flags = pd.cut(df["AVAIL_RATE"], bins=bins, labels=list(_AVAIL_MULTIPLIERS), right=False)
+    df["AVAIL_FLAG"] = flags.astype(object).fillna("Fragile").astype(str)
+    df["AVAIL_MULTIPLIER"] = df["AVAIL_FLAG"].map(_AVAIL_MULTIPLIERS).astype("float64")
     return df
 
 
@@ -463,35 +683,57 @@ def check_recent_activity(
     # Build lookup from DataFrame if provided
     df_lookup: dict[str, dict] = {}
     if stats_df is not None and not stats_df.empty:
-        for _, row in stats_df.iterrows():
-            pk = str(row.get("PLAYER_KEY", ""))
+        # Only the requested candidates matter — filter before iterating
+        # rather than walking the whole league table.
+        if "PLAYER_KEY" in stats_df.columns:
+            stats_df = stats_df[stats_df["PLAYER_KEY"].astype(str).isin(player_keys)]
+        def _col(name: str, default: Any) -> Any:
+            if name in stats_df.columns:
+                return stats_df[name].to_numpy()
+            return [default] * len(stats_df)
+
+        # Classify statuses for the whole column at once.
+        if "STATUS" in stats_df.columns:
+            status = stats_df["STATUS"].astype(str).str.upper()
+            injured = status.isin(_INJURED_STATUSES).to_numpy()
+            questionable = status.isin(_QUESTIONABLE_STATUSES).to_numpy()
+        else:
+            injured = questionable = [False] * len(stats_df)
+
+        # Zip raw columns rather than iterrows() — no per-row Series.
+        for pk, gp, rate, is_injured, is_questionable, flag in zip(
+            _col("PLAYER_KEY", ""),
+            _col("GP", 0),
+            _col("AVAIL_RATE", 0),
+            injured,
+            questionable,
+            _col("AVAIL_FLAG", "Unknown"),
+        ):
+            pk = str(pk)
             if pk:
                 df_lookup[pk] = {
-                    "gp": int(row.get("GP", 0)),
-                    "avail_rate": float(row.get("AVAIL_RATE", 0)),
-                    "status": str(row.get("STATUS", "") or ""),
-                    "avail_flag": str(row.get("AVAIL_FLAG", "Unknown")),
+                    "gp": int(gp),
+                    "avail_rate": float(rate),
+                    "injured": bool(is_injured),
+                    "questionable": bool(is_questionable),
+                    "avail_flag": str(flag),
                 }
 
     for pk in player_keys:
         info = df_lookup.get(pk, {})
         gp = info.get("gp", 0)
         avail_rate = info.get("avail_rate", 0)
-        status = info.get("status", "").upper()
 
         # Estimate games in last 14 days from GP and availability rate
         # Rough: teams play ~4 games per week → ~8 in 14 days
         games_14d = int(avail_rate * 8) if avail_rate > 0 else 0
 
         # Determine activity flag
-        injury_statuses = {"INJ", "O", "SUSP", "NA", "OUT"}
-        questionable_statuses = {"DTD", "GTD"}
-
-        if status in injury_statuses:
+        if info.get("injured"):
             flag = "Inactive"
             is_inactive = True
             days_since = days + 1  # unknown but likely > threshold
-        elif status in questionable_statuses:
+        elif info.get("questionable"):
             flag = "Questionable"
             is_inactive = False
             days_since = 3
@@ -527,20 +769,60 @@ def check_recent_activity(
 # Recent game stats for hot-pickup analysis
 # ---------------------------------------------------------------------------
 
+def _date_lines_cache_name(date_str: str) -> str:
+    """Cache entry holding every fetched per-date stat line for *date_str*."""
+    return f"datelines-{config.YAHOO_LEAGUE_ID}-{date_str}.pkl"
+
+
+def _date_lines_final(date_str: str, fetched_at: datetime) -> bool:
+    """True when lines for *date_str* were fetched after its games were final.
+
+    Late tip-offs run past midnight and Yahoo settles stat corrections
+    overnight, so a date only counts as final from the second day after it.
+    """
+    return fetched_at.date() >= date.fromisoformat(date_str) + timedelta(days=2)
+
+
+def _load_date_lines(date_str: str) -> dict[str, Any]:
+    """Load the cached ``{"fetched_at", "lines"}`` entry for *date_str*.
+
+    Entries fetched once the date was final are reused indefinitely; any
+    other entry (today, yesterday, or written before games finished) is
+    only trusted for ``config.RECENT_STATS_PROVISIONAL_TTL`` seconds after
+    it was fetched.  A fresh, empty entry is returned on a miss.
+    """
+    entry = load_pickle(_date_lines_cache_name(date_str))
+    now = datetime.now()
+    if isinstance(entry, dict) and isinstance(entry.get("fetched_at"), datetime):
+        fetched_at = entry["fetched_at"]
+        age = (now - fetched_at).total_seconds()
+        if _date_lines_final(date_str, fetched_at) or age <= config.RECENT_STATS_PROVISIONAL_TTL:
+            return entry
+    return {"fetched_at": now, "lines": {}}
+
+
 def compute_recent_game_stats(
     player_keys: list[str],
     query: YahooFantasySportsQuery,
     last_n: int | None = None,
+    team_game_dates: dict[str, list[date]] | None = None,
+    player_teams: dict[str, str] | None = None,
 ) -> dict[str, dict]:
     """Compute per-game averages from a player's last N games via Yahoo date-stats.
 
     Scans recent dates, collects game-day stat lines, and averages the most
-    recent ``last_n`` games.
+    recent ``last_n`` games.  When the schedule is supplied, dates on which a
+    player's team had no game are skipped without a Yahoo request.
 
     Args:
         player_keys: Yahoo player keys to evaluate.
         query: Authenticated yfpy query instance.
         last_n: Number of recent games. Defaults to config.HOT_PICKUP_RECENT_GAMES.
+        team_game_dates: Optional team tricode → game dates covering the
+            lookback window (from ``schedule_analyzer.get_team_game_dates``).
+        player_teams: Optional player_key → team tricode, matching the keys
+            of ``team_game_dates``.  Players whose team is unknown are
+            scanned on every date.
 
     Returns:
         Dict of player_key → {stat_col: avg_value, ..., games_used: int}.
@@ -564,59 +846,112 @@ def compute_recent_game_stats(
         15: "REB", 16: "AST", 17: "STL", 18: "BLK", 19: "TOV",
     }
 
-    results: dict[str, dict] = {}
+    # Any of these being non-zero means the player logged minutes that day.
+    _PLAYED_SIDS = frozenset({12, 15, 16, 17, 18})  # PTS, REB, AST, STL, BLK
 
-    for pk in player_keys:
-        game_lines: list[dict[str, float]] = []
-
-        for date_str in dates:
-            if len(game_lines) >= last_n:
+    def _fetch_line(task: tuple[str, str]) -> tuple[bool, dict[str, float] | None]:
+        """Return (fetched, line); line is None when the player didn't play."""
+        pk, date_str = task
+        try:
+            data = query.get_player_stats_by_date(pk, chosen_date=date_str)
+            ps = getattr(data, "player_stats", None)
+            stat_list = getattr(ps, "stats", []) if ps else []
+
+            # Did the player actually play?  Tally the counting stats
+            # (PTS/REB/AST/STL/BLK) while parsing instead of re-reading the line.
+            line: dict[str, float] = {}
+            played_total = 0.0
+            for s in stat_list:
+                st = s.stat if hasattr(s, "stat") else s
+                sid = getattr(st, "stat_id", None)
+                val = float(getattr(st, "value", 0) or 0)
+                if sid is not None and int(sid) in _DATE_SID_TO_COL:
+                    sid = int(sid)
+                    line[_DATE_SID_TO_COL[sid]] = val
+                    if sid in _PLAYED_SIDS:
+                        played_total += val
+        except Exception:
+            return False, None
+
+        return True, (line if played_total > 0 else None)
+
+    # Stat lines never change once a date's games are final, so each date's
+    # lines (player_key → line, or None for "didn't play") are kept on disk
+    # with the time they were fetched and reused across runs.  See
+    # ``_load_date_lines`` for when an entry counts as final.
+    date_entries: dict[str, dict[str, Any]] = {}
+    dirty_dates: set[str] = set()
+
+    def _lines_for(date_str: str) -> dict[str, dict[str, float] | None]:
+        if date_str not in date_entries:
+            date_entries[date_str] = _load_date_lines(date_str)
+        return date_entries[date_str]["lines"]
+
+    # Dates each player's team actually played (None = scan every date).
+    played_dates: dict[str, set[str]] = {}
+    if team_game_dates and player_teams:
+        team_played = {
+            team: {d.strftime("%Y-%m-%d") for d in game_dates}
+            for team, game_dates in team_game_dates.items()
+        }
+        for pk in player_keys:
+            team = player_teams.get(pk)
+            if team in team_played:
+                played_dates[pk] = team_played[team]
+
+    # Every (player, date) lookup is independent, so issue them across a
+    # pool.  Dates are scanned newest-first in waves; players who already
+    # have ``last_n`` games drop out before the next wave is submitted.
+    # Request pacing is left to the shared limiter in the patched yfpy
+    # get_response.
+    game_lines_by_pk: dict[str, list[dict[str, float]]] = {pk: [] for pk in player_keys}
+    pending = list(game_lines_by_pk)
+    with ThreadPoolExecutor(max_workers=_RECENT_FETCH_WORKERS) as pool:
+        for w in range(0, max_lookback, _RECENT_DATE_WAVE):
+            if not pending:
                 break
-            try:
-                data = query.get_player_stats_by_date(pk, chosen_date=date_str)
-                ps = getattr(data, "player_stats", None)
-                stat_list = getattr(ps, "stats", []) if ps else []
-
-                line: dict[str, float] = {}
-                for s in stat_list:
-                    st = s.stat if hasattr(s, "stat") else s
-                    sid = getattr(st, "stat_id", None)
-                    val = float(getattr(st, "value", 0) or 0)
-                    if sid is not None and int(sid) in _DATE_SID_TO_COL:
-                        line[_DATE_SID_TO_COL[int(sid)]] = val
-
-                # Did the player actually play?  Check PTS or any counting stat > 0.
-                pts = line.get("PTS", 0)
-                reb = line.get("REB", 0)
-                ast = line.get("AST", 0)
-                if pts > 0 or reb > 0 or ast > 0:
-                    game_lines.append(line)
-
-            except Exception:
-                pass
+            wave_dates = dates[w : w + _RECENT_DATE_WAVE]
+            tasks = [
+                (pk, d) for pk in pending for d in wave_dates
+                if pk not in played_dates or d in played_dates[pk]
+            ]
+            to_fetch = [(pk, d) for pk, d in tasks if pk not in _lines_for(d)]
+            for (pk, d), (fetched, line) in zip(to_fetch, pool.map(_fetch_line, to_fetch)):
+                if fetched:
+                    _lines_for(d)[pk] = line
+                    dirty_dates.add(d)
+            # Tasks are in newest-date-first order per player
+            for pk, d in tasks:
+                line = _lines_for(d).get(pk)
+                lines = game_lines_by_pk[pk]
+                if line is not None and len(lines) < last_n:
+                    lines.append(line)
+            pending = [pk for pk in pending if len(game_lines_by_pk[pk]) < last_n]
+
+    for d in dirty_dates:
+        save_pickle(_date_lines_cache_name(d), date_entries[d])
 
-            time.sleep(0.1)
+    results: dict[str, dict] = {}
 
+    for pk, game_lines in game_lines_by_pk.items():
         if not game_lines:
             continue
 
-        # Compute averages
+        # One (games × stat_cols) array per player; every average and the
+        # shooting totals come from column reductions over it.
+        arr = np.array(
+            [[g.get(col, 0.0) for col in stat_cols] for g in game_lines],
+            dtype=np.float64,
+        )
         averages: dict[str, float] = {"games_used": len(game_lines)}
-        for col in stat_cols:
-            vals = [g.get(col, 0) for g in game_lines]
-            if vals:
-                averages[col] = sum(vals) / len(vals)
+        averages.update(zip(stat_cols, arr.mean(axis=0).tolist()))
 
         # Recompute FG%/FT% from totals if we have the counting stats
-        total_fga = sum(g.get("FGA", 0) for g in game_lines)
-        total_fgm = sum(g.get("FGM", 0) for g in game_lines)
-        if total_fga > 0:
-            averages["FG_PCT"] = total_fgm / total_fga
-
-        total_fta = sum(g.get("FTA", 0) for g in game_lines)
-        total_ftm = sum(g.get("FTM", 0) for g in game_lines)
-        if total_fta > 0:
-            averages["FT_PCT"] = total_ftm / total_fta
+        totals = dict(zip(stat_cols, arr.sum(axis=0).tolist()))
+        if totals["FGA"] > 0:
+            averages["FG_PCT"] = totals["FGM"] / totals["FGA"]
+        if totals["FTA"] > 0:
+            averages["FT_PCT"] = totals["FTM"] / totals["FTA"]
 
         results[pk] = averages
 
@@ -645,79 +980,83 @@ def compute_hot_pickup_scores(
     Returns:
         Dict of player_key → {recent_z_total, season_z_total, z_delta, is_hot, games_used}.
     """
-    counting_cols = ["FG3M", "PTS", "REB", "AST", "STL", "BLK", "TOV"]
     league_means: dict[str, float] = {}
     league_stds: dict[str, float] = {}
 
-    for col in counting_cols:
-        if col in season_df.columns:
-            league_means[col] = float(season_df[col].mean())
-            league_stds[col] = float(season_df[col].std())
-
-    for pct_col, vol_col in [("FG_PCT", "FGA"), ("FT_PCT", "FTA")]:
-        if pct_col in season_df.columns and vol_col in season_df.columns:
-            pct = season_df[pct_col].astype(float)
+    for stat_key, vol_col, _, _ in _HOT_CAT_SPEC:
+        if vol_col is None:
+            if stat_key in season_df.columns:
+                league_means[stat_key] = float(season_df[stat_key].mean())
+                league_stds[stat_key] = float(season_df[stat_key].std())
+        elif stat_key in season_df.columns and vol_col in season_df.columns:
+            pct = season_df[stat_key].astype(float)
             vol = season_df[vol_col].astype(float)
             avg_pct = pct.mean()
             impact = vol * (pct - avg_pct)
-            league_means[f"{pct_col}_impact_mean"] = float(impact.mean())
-            league_stds[f"{pct_col}_impact_std"] = float(impact.std())
-            league_means[f"{pct_col}_avg"] = float(avg_pct)
+            league_means[f"{stat_key}_impact_mean"] = float(impact.mean())
+            league_stds[f"{stat_key}_impact_std"] = float(impact.std())
+            league_means[f"{stat_key}_avg"] = float(avg_pct)
 
     punt_names = {c.upper() for c in config.PUNT_CATEGORIES}
 
     # Build player_key → season Z_TOTAL lookup
     season_z_lookup: dict[str, float] = {}
     if "PLAYER_KEY" in season_df.columns and "Z_TOTAL" in season_df.columns:
-        for _, row in season_df.iterrows():
-            season_z_lookup[str(row["PLAYER_KEY"])] = float(row["Z_TOTAL"])
+        season_z_lookup = dict(zip(
+            season_df["PLAYER_KEY"].astype(str),
+            season_df["Z_TOTAL"].astype(float),
+        ))
+
+    if not recent_stats:
+        return {}
+
+    # One row per player; a stat a player lacks becomes NaN and simply
+    # doesn't contribute, exactly like the old per-key membership check.
+    recent_df = pd.DataFrame(list(recent_stats.values()), index=list(recent_stats))
+    n_players = len(recent_df)
+
+    def _values(col: str) -> np.ndarray:
+        if col in recent_df.columns:
+            return pd.to_numeric(recent_df[col], errors="coerce").to_numpy(dtype=np.float64)
+        return np.full(n_players, np.nan)
+
+    # Accumulate category by category (same order as STAT_CATEGORIES) so
+    # each step is one array operation across all players.
+    means_get = league_means.get
+    stds_get = league_stds.get
+    z_sum = np.zeros(n_players)
+    for stat_key, vol_col, sign, cat_name in _HOT_CAT_SPEC:
+        if cat_name in punt_names:
+            continue
 
-    results: dict[str, dict] = {}
+        vals = _values(stat_key)
+        if vol_col:
+            vol = np.nan_to_num(_values(vol_col), nan=0.0)
+            vals = vol * (vals - means_get(f"{stat_key}_avg", 0))
+            mean = means_get(f"{stat_key}_impact_mean", 0)
+            std = stds_get(f"{stat_key}_impact_std", 1)
+        else:
+            mean = means_get(stat_key, 0)
+            std = stds_get(stat_key, 1)
+        if not std > 0:
+            continue
+
+        z_sum += np.nan_to_num((vals - mean) / std * sign, nan=0.0)
 
-    for pk, stats in recent_stats.items():
-        z_sum = 0.0
-        n_cats = 0
-
-        for stat_key, cat_info in config.STAT_CATEGORIES.items():
-            cat_name_upper = cat_info["name"].upper()
-            if cat_name_upper in punt_names:
-                continue
-
-            vol_col = cat_info.get("volume_col")
-
-            if vol_col and stat_key in stats:
-                pct_val = stats.get(stat_key, 0)
-                vol_val = stats.get(vol_col, 0)
-                avg_pct = league_means.get(f"{stat_key}_avg", 0)
-                impact = vol_val * (pct_val - avg_pct)
-                imp_mean = league_means.get(f"{stat_key}_impact_mean", 0)
-                imp_std = league_stds.get(f"{stat_key}_impact_std", 1)
-                if imp_std > 0:
-                    z = (impact - imp_mean) / imp_std
-                    if not cat_info["higher_is_better"]:
-                        z = -z
-                    z_sum += z
-                    n_cats += 1
-            elif stat_key in stats:
-                val = stats[stat_key]
-                mean = league_means.get(stat_key, 0)
-                std = league_stds.get(stat_key, 1)
-                if std > 0:
-                    z = (val - mean) / std
-                    if not cat_info["higher_is_better"]:
-                        z = -z
-                    z_sum += z
-                    n_cats += 1
-
-        season_z = season_z_lookup.get(pk, 0.0)
-        z_delta = z_sum - season_z
+    season_z = np.array(
+        [season_z_lookup.get(str(pk), 0.0) for pk in recent_df.index],
+        dtype=np.float64,
+    )
+    z_delta = z_sum - season_z
 
+    results: dict[str, dict] = {}
+    for pk, recent_z, szt, delta in zip(recent_df.index, z_sum, season_z, z_delta):
         results[pk] = {
-            "recent_z_total": round(z_sum, 2),
-            "season_z_total": round(season_z, 2),
-            "z_delta": round(z_delta, 2),
-            "games_used": stats.get("games_used", 0),
-            "is_hot": z_delta >= 1.0,
+            "recent_z_total": round(float(recent_z), 2),
+            "season_z_total": round(float(szt), 2),
+            "z_delta": round(float(delta), 2),
+            "games_used": recent_stats[pk].get("games_used", 0),
+            "is_hot": bool(delta >= 1.0),
         }
 
     return results
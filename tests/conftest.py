@@ -0,0 +1,18 @@
+"""Shared pytest fixtures."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import config  # noqa: E402
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point the on-disk cache at a temporary directory."""
+    monkeypatch.setattr(config, "CACHE_ENABLED", True)
+    monkeypatch.setattr(config, "CACHE_DIR", tmp_path)
+    return tmp_path
@@ -0,0 +1,60 @@
+"""Auth retry and fail-fast breaker in _patch_get_response."""
+
+import pytest
+
+from src import yahoo_fantasy
+from src.yahoo_fantasy import _patch_get_response
+
+
+class FakeQuery:
+    """get_response always fails with an auth error (or succeeds if *ok*)."""
+
+    def __init__(self, ok=False):
+        self.ok = ok
+        self.calls = 0
+        self.oauth = object()
+
+    def get_response(self, url):
+        self.calls += 1
+        if self.ok:
+            return "response"
+        raise RuntimeError("You must be logged in to perform this action")
+
+    def _authenticate(self):
+        self.oauth = object()
+
+
+@pytest.fixture(autouse=True)
+def no_waits(monkeypatch):
+    monkeypatch.setattr(yahoo_fantasy.time, "sleep", lambda s: None)
+    monkeypatch.setattr(yahoo_fantasy, "_ensure_pooled_session", lambda q: None)
+    monkeypatch.setattr(yahoo_fantasy, "_acquire_request_token", lambda: None)
+
+
+def test_breaker_fails_fast_with_fresh_exception():
+    query = FakeQuery()
+    _patch_get_response(query)
+
+    with pytest.raises(RuntimeError, match="logged in") as first:
+        query.get_response("u")
+    calls = query.calls
+
+    with pytest.raises(RuntimeError, match="auth unavailable") as second:
+        query.get_response("u")
+    with pytest.raises(RuntimeError, match="auth unavailable") as third:
+        query.get_response("u")
+
+    assert query.calls == calls
+    assert second.value is not third.value
+    assert second.value.__cause__ is first.value
+
+
+def test_breaker_is_scoped_to_the_query():
+    failing = FakeQuery()
+    _patch_get_response(failing)
+    with pytest.raises(RuntimeError):
+        failing.get_response("u")
+
+    healthy = FakeQuery(ok=True)
+    _patch_get_response(healthy)
+    assert healthy.get_response("u") == "response"
@@ -0,0 +1,108 @@
+"""Per-date stat line cache used by compute_recent_game_stats."""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import config
+from src.cache import load_pickle, save_pickle
+from src.yahoo_stats import _date_lines_cache_name, compute_recent_game_stats
+
+PK = "428.p.1234"
+
+
+class FakeQuery:
+    """Returns a 20-point line for every (player, date) request."""
+
+    def __init__(self):
+        self.calls = []
+
+    def get_player_stats_by_date(self, player_key, chosen_date):
+        self.calls.append((player_key, chosen_date))
+        stat = SimpleNamespace(stat=SimpleNamespace(stat_id=12, value=20))
+        return SimpleNamespace(player_stats=SimpleNamespace(stats=[stat]))
+
+
+def _days_ago(n):
+    return datetime.now() - timedelta(days=n)
+
+
+def _run(query, day):
+    """Scan only *day* for PK (its team's single game in the window)."""
+    return compute_recent_game_stats(
+        [PK], query, last_n=1,
+        team_game_dates={"LAL": [day.date()]},
+        player_teams={PK: "LAL"},
+    )
+
+
+def _seed(day, fetched_at, lines):
+    save_pickle(
+        _date_lines_cache_name(day.strftime("%Y-%m-%d")),
+        {"fetched_at": fetched_at, "lines": lines},
+    )
+
+
+def test_line_written_before_games_finished_is_refetched(cache_dir):
+    # Written yesterday while the game was in progress: "didn't play".
+    day = _days_ago(1)
+    _seed(day, fetched_at=day, lines={PK: None})
+
+    query = FakeQuery()
+    result = _run(query, day)
+
+    assert query.calls == [(PK, day.strftime("%Y-%m-%d"))]
+    assert result[PK]["PTS"] == 20.0
+
+
+def test_none_line_for_previous_day_is_not_final(cache_dir):
+    # Fetched today (after midnight) — yesterday's late games may still be running.
+    day = _days_ago(1)
+    _seed(day, fetched_at=datetime.now() - timedelta(hours=1), lines={PK: None})
+
+    query = FakeQuery()
+    _run(query, day)
+
+    assert len(query.calls) == 1
+
+
+def test_final_entry_is_reused(cache_dir):
+    day = _days_ago(5)
+    _seed(day, fetched_at=_days_ago(3), lines={PK: None})
+
+    query = FakeQuery()
+    result = _run(query, day)
+
+    assert query.calls == []
+    assert PK not in result
+
+
+def test_provisional_entry_reused_within_ttl(cache_dir):
+    day = _days_ago(0)
+    _seed(day, fetched_at=datetime.now(), lines={PK: {"PTS": 7.0}})
+
+    query = FakeQuery()
+    result = _run(query, day)
+
+    assert query.calls == []
+    assert result[PK]["PTS"] == 7.0
+
+
+def test_fetched_lines_saved_with_fetch_time(cache_dir):
+    day = _days_ago(0)
+    query = FakeQuery()
+    _run(query, day)
+
+    entry = load_pickle(_date_lines_cache_name(day.strftime("%Y-%m-%d")))
+    assert entry["lines"][PK]["PTS"] == 20.0
+    age = (datetime.now() - entry["fetched_at"]).total_seconds()
+    assert 0 <= age < config.RECENT_STATS_PROVISIONAL_TTL
+
+
+def test_legacy_entry_without_fetch_time_is_ignored(cache_dir):
+    day = _days_ago(5)
+    save_pickle(_date_lines_cache_name(day.strftime("%Y-%m-%d")), {PK: None})
+
+    query = FakeQuery()
+    _run(query, day)
+
+    assert len(query.calls) == 1
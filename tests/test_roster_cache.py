@@ -0,0 +1,125 @@
+"""On-disk roster cache used by get_all_team_rosters."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src import yahoo_fantasy
+from src.cache import cache_path, load_json, save_json
+from src.yahoo_fantasy import (
+    _ROSTER_FIELDS, _encode_roster_cache, _roster_cache_name, get_all_team_rosters,
+)
+
+
+def _player(name, key):
+    return SimpleNamespace(
+        name=SimpleNamespace(full=name), player_key=key,
+        editorial_team_abbr="LAL", display_position="PG", status="",
+    )
+
+
+ROSTERS = {
+    1: [_player("Alpha One", "428.p.1")],
+    2: [_player("Beta Two", "428.p.2")],
+}
+
+
+class FakeQuery:
+    """Two-team league; teams listed in *failing* raise on roster lookup."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.roster_calls = 0
+
+    def get_league_teams(self):
+        return [SimpleNamespace(team_id=tid, name=f"Team {tid}") for tid in ROSTERS]
+
+    def get_team_roster_player_info_by_date(self, team_id):
+        self.roster_calls += 1
+        if team_id in self.failing:
+            raise RuntimeError("boom")
+        return ROSTERS[team_id]
+
+
+@pytest.fixture(autouse=True)
+def no_batch(monkeypatch):
+    """Force the per-team fallback path."""
+    def _fail(query, team_ids):
+        raise RuntimeError("batch unavailable")
+    monkeypatch.setattr(yahoo_fantasy, "_get_rosters_batch", _fail)
+
+
+def test_complete_rosters_are_cached_and_reused(cache_dir):
+    rosters, owned = get_all_team_rosters(FakeQuery())
+    assert set(rosters) == {"Team 1", "Team 2"}
+    assert cache_path(_roster_cache_name()).exists()
+
+    query = FakeQuery()
+    cached_rosters, cached_owned = get_all_team_rosters(query)
+    assert query.roster_calls == 0
+    assert {
+        team: [{f: d[f] for f in _ROSTER_FIELDS} for d in players]
+        for team, players in rosters.items()
+    } == cached_rosters
+    assert cached_owned == owned
+
+
+def test_force_refresh_bypasses_fresh_cache(cache_dir):
+    save_json(_roster_cache_name(), _encode_roster_cache({"Team 9": [{"name": "Gamma Nine"}]}))
+
+    query = FakeQuery()
+    rosters, owned = get_all_team_rosters(query, force_refresh=True)
+
+    assert query.roster_calls == 2
+    assert set(rosters) == {"Team 1", "Team 2"}
+    assert "gamma nine" not in owned
+
+
+def test_partial_rosters_are_not_cached(cache_dir):
+    rosters, owned = get_all_team_rosters(FakeQuery(failing={2}))
+
+    assert set(rosters) == {"Team 1"}
+    assert owned == {"alpha one"}
+    assert load_json(_roster_cache_name()) is None
+
+
+def test_partial_fetch_keeps_previous_cache(cache_dir):
+    get_all_team_rosters(FakeQuery())
+    previous = load_json(_roster_cache_name())
+
+    get_all_team_rosters(FakeQuery(failing={1}), force_refresh=True)
+
+    assert load_json(_roster_cache_name()) == previous
+
+
+def test_corrupt_cache_is_a_miss(cache_dir):
+    save_json(_roster_cache_name(), {"v": _encode_roster_cache({})["v"], "teams": {"Team 9": {}}})
+
+    query = FakeQuery()
+    rosters, _ = get_all_team_rosters(query)
+
+    assert query.roster_calls == 2
+    assert set(rosters) == {"Team 1", "Team 2"}
+
+
+def test_corrupt_stale_cache_keeps_fetch_error(cache_dir, monkeypatch):
+    save_json(_roster_cache_name(), {"v": _encode_roster_cache({})["v"], "fields": ["name"]})
+
+    def _raise(query):
+        raise RuntimeError("offline")
+    monkeypatch.setattr(yahoo_fantasy, "get_league_teams", _raise)
+
+    with pytest.raises(RuntimeError, match="offline"):
+        get_all_team_rosters(FakeQuery(), force_refresh=True)
+
+
+def test_stale_cache_used_when_fetch_fails(cache_dir, monkeypatch):
+    save_json(_roster_cache_name(), _encode_roster_cache({"Team 9": [{"name": "Gamma Nine"}]}))
+
+    def _raise(query):
+        raise RuntimeError("offline")
+    monkeypatch.setattr(yahoo_fantasy, "get_league_teams", _raise)
+
+    rosters, owned = get_all_team_rosters(FakeQuery(), force_refresh=True)
+    assert list(rosters) == ["Team 9"]
+    assert owned == {"gamma nine"}
@@ -0,0 +1,46 @@
+"""Output columns of waiver_advisor.score_available_players."""
+
+import numpy as np
+import pandas as pd
+
+import config
+from src.waiver_advisor import score_available_players
+
+COUNTING = [k for k in config.STAT_CATEGORIES if "PCT" not in k]
+
+
+def _stats(n=4):
+    df = pd.DataFrame({
+        "PLAYER_NAME": [f"Player {i}" for i in range(n)],
+        "PLAYER_KEY": [f"428.p.{i}" for i in range(n)],
+        "TEAM_ABBREVIATION": ["LAL"] * n,
+        "GP": [20] * n,
+        "MIN": np.linspace(20.0, 30.0, n),
+        "AVAIL_RATE": [0.9] * n,
+        "AVAIL_FLAG": ["Healthy"] * n,
+        "AVAIL_MULTIPLIER": [1.0] * n,
+    })
+    for k in config.STAT_CATEGORIES:
+        df[k] = np.linspace(0.4, 0.5, n) if "PCT" in k else np.linspace(1.04, 9.96, n)
+        df[f"Z_{k}"] = np.linspace(-1.0, 1.0, n)
+    df["Z_TOTAL"] = df[[f"Z_{k}" for k in config.STAT_CATEGORIES]].sum(axis=1)
+    return df
+
+
+def test_counting_stat_columns_are_float():
+    out = score_available_players(_stats())
+
+    for k in COUNTING:
+        col = out[config.STAT_CATEGORIES[k]["name"]]
+        assert col.dtype == np.float64
+        assert col.round(1).equals(col)
+
+
+def test_missing_counting_stat_shown_as_dash():
+    df = _stats()
+    df.loc[0, "PTS"] = np.nan
+    out = score_available_players(df).set_index("Player")
+
+    assert out.loc["Player 0", "PTS"] == "-"
+    assert out.loc["Player 1", "PTS"] == round(df.loc[1, "PTS"], 1)
+    assert out["REB"].dtype == np.float64
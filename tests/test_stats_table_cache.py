@@ -0,0 +1,76 @@
+"""Daily stats-table cache used by load_player_stats_table."""
+
+import pandas as pd
+import pytest
+
+import config
+from src import yahoo_stats
+from src.yahoo_stats import load_player_stats_table
+
+PK = "428.p.1234"
+
+
+@pytest.fixture(autouse=True)
+def fresh_memo(cache_dir, monkeypatch):
+    """Start each test with an empty in-process table cache."""
+    monkeypatch.setattr(yahoo_stats, "_STATS_TABLE_CACHE", {})
+    monkeypatch.setattr(config, "PUNT_CATEGORIES", [])
+
+
+def _stub(monkeypatch, status, notes=False):
+    """Build a one-player table; the league list reports *status* / *notes*."""
+    builds = []
+
+    def _build(query):
+        builds.append(config.YAHOO_LEAGUE_ID)
+        return pd.DataFrame({
+            "PLAYER_KEY": [PK],
+            "PLAYER_NAME": [f"Player {config.YAHOO_LEAGUE_ID}"],
+            "STATUS": pd.Categorical([""]),
+            "HAS_RECENT_NOTES": [False],
+            "Z_TOTAL": [1.0],
+        })
+
+    def _keys(query):
+        return [PK], ({PK: True} if notes else {}), {PK: status}
+
+    monkeypatch.setattr(yahoo_stats, "build_player_stats_table", _build)
+    monkeypatch.setattr(yahoo_stats, "_load_league_player_keys", _keys)
+    return builds
+
+
+def test_memo_is_keyed_by_league(monkeypatch):
+    builds = _stub(monkeypatch, status="")
+
+    monkeypatch.setattr(config, "YAHOO_LEAGUE_ID", "111")
+    load_player_stats_table(None)
+    monkeypatch.setattr(config, "YAHOO_LEAGUE_ID", "222")
+    df = load_player_stats_table(None)
+
+    assert builds == ["111", "222"]
+    assert df["PLAYER_NAME"].tolist() == ["Player 222"]
+
+
+def test_sample_filter_change_rebuilds(monkeypatch):
+    builds = _stub(monkeypatch, status="")
+
+    load_player_stats_table(None)
+    monkeypatch.setattr(config, "STATS_MIN_GP", config.STATS_MIN_GP + 5)
+    load_player_stats_table(None)
+    monkeypatch.setattr(config, "AVAILABILITY_HEALTHY", config.AVAILABILITY_HEALTHY - 0.05)
+    load_player_stats_table(None)
+
+    assert len(builds) == 3
+
+
+def test_cache_hit_picks_up_new_status_and_notes(monkeypatch):
+    builds = _stub(monkeypatch, status="")
+    load_player_stats_table(None)
+
+    # Ruled out later the same day.
+    builds = _stub(monkeypatch, status="O", notes=True)
+    df = load_player_stats_table(None)
+
+    assert builds == []
+    assert df["STATUS"].astype(str).tolist() == ["O"]
+    assert df["HAS_RECENT_NOTES"].tolist() == [True]
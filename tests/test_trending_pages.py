@@ -0,0 +1,179 @@
+"""League player pages (trending and full pool) read straight from Yahoo's JSON."""
+
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from src.yahoo_fantasy import (
+    _TRENDING_PAGE_SIZE, _fetch_trending_page, _parse_league_players_json,
+    fetch_all_league_players,
+)
+
+# Trimmed from a real ``league/{key}/players;out=percent_owned`` response.
+PAYLOAD = {
+    "fantasy_content": {
+        "league": [
+            {"league_key": "428.l.94443", "name": "Test League", "num_teams": 12},
+            {
+                "players": {
+                    "0": {
+                        "player": [
+                            [
+                                {"player_key": "428.p.6014"},
+                                {"player_id": "6014"},
+                                {"name": {"full": "Jalen Duren", "first": "Jalen", "last": "Duren"}},
+                                {"status": "GTD"},
+                                {"editorial_team_abbr": "Det"},
+                                {"display_position": "C"},
+                                {"has_recent_player_notes": 1},
+                            ],
+                            {
+                                "percent_owned": [
+                                    {"coverage_type": "week"},
+                                    {"week": "5"},
+                                    {"value": "87"},
+                                    {"delta": "+3.5"},
+                                ]
+                            },
+                        ]
+                    },
+                    "1": {
+                        "player": [
+                            [
+                                {"player_key": "428.p.6700"},
+                                {"player_id": "6700"},
+                                {"name": {"full": "Ryan Dunn", "first": "Ryan", "last": "Dunn"}},
+                                {"editorial_team_abbr": "Pho"},
+                                {"display_position": "SF"},
+                            ],
+                            {
+                                "percent_owned": [
+                                    {"coverage_type": "week"},
+                                    {"week": "5"},
+                                    {"value": 4},
+                                    {"delta": "-1"},
+                                ]
+                            },
+                        ]
+                    },
+                    "count": 2,
+                }
+            },
+        ]
+    }
+}
+
+
+class FakeQuery:
+    """Serves *payload* for raw page requests; records the yfpy fallback call."""
+
+    def __init__(self, payload=None):
+        self.payload = payload
+        self.urls = []
+        self.fallback_kwargs = None
+
+    def get_league_key(self):
+        return "428.l.94443"
+
+    def get_response(self, url):
+        self.urls.append(url)
+        return SimpleNamespace(json=self._json)
+
+    def _json(self):
+        if self.payload is None:
+            raise ValueError("Expecting value: line 1 column 1 (char 0)")
+        return self.payload
+
+    def get_league_players(self, **kwargs):
+        self.fallback_kwargs = kwargs
+        return []
+
+
+def test_parse_reads_percent_owned():
+    players = _parse_league_players_json(PAYLOAD)
+
+    assert [p["name"] for p in players] == ["Jalen Duren", "Ryan Dunn"]
+    duren, dunn = players
+    assert duren["player_key"] == "428.p.6014"
+    assert duren["status"] == "GTD"
+    assert duren["has_recent_notes"] is True
+    assert (duren["percent_owned"], duren["percent_owned_delta"]) == (87.0, 3.5)
+    assert (dunn["percent_owned"], dunn["percent_owned_delta"]) == (4.0, -1.0)
+    assert dunn["status"] == ""
+
+
+def test_trending_page_requests_percent_owned():
+    query = FakeQuery(PAYLOAD)
+
+    players = _fetch_trending_page(query, 50)
+
+    assert len(players) == 2
+    assert query.urls == [
+        "https://fantasysports.yahooapis.com/fantasy/v2/league/428.l.94443/"
+        f"players;start=50;count={_TRENDING_PAGE_SIZE};out=percent_owned"
+    ]
+    assert query.fallback_kwargs is None
+
+
+def test_fallback_page_bounds_are_absolute():
+    query = FakeQuery(payload=None)  # non-JSON body → yfpy fallback
+
+    assert _fetch_trending_page(query, 50) == []
+    assert query.fallback_kwargs == {
+        "player_count_start": 50,
+        "player_count_limit": 50 + _TRENDING_PAGE_SIZE,
+    }
+
+
+def _pool_payload(start, count, total):
+    """A league players page of *count* players from a pool of *total*."""
+    keys = range(start, min(start + count, total))
+    players = {
+        str(i): {"player": [[{"player_key": f"428.p.{k}"}, {"name": {"full": f"Player {k}"}}]]}
+        for i, k in enumerate(keys)
+    }
+    return {"fantasy_content": {"league": [{}, {"players": {**players, "count": len(players)}}]}}
+
+
+class PoolQuery(FakeQuery):
+    """Pages a 30-player pool; *failures* maps page start -> times to fail."""
+
+    def __init__(self, failures=None, payload=None):
+        super().__init__()
+        self.failures = dict(failures or {})
+        self.bad_payload = payload
+
+    def get_response(self, url):
+        self.urls.append(url)
+        start, count = map(int, re.search(r"start=(\d+);count=(\d+)", url).groups())
+        if self.failures.get(start):
+            self.failures[start] -= 1
+            raise ConnectionError("connection reset")
+        payload = self.bad_payload or _pool_payload(start, count, total=30)
+        return SimpleNamespace(json=lambda: payload)
+
+
+def test_failed_page_is_retried_alone():
+    query = PoolQuery(failures={0: 1})
+
+    players = fetch_all_league_players(query)
+
+    assert [p["player_key"] for p in players] == [f"428.p.{k}" for k in range(30)]
+    assert sum("start=0;" in url for url in query.urls) == 2
+    assert query.fallback_kwargs is None
+
+
+def test_page_failing_twice_raises_without_yfpy_walk():
+    query = PoolQuery(failures={25: 2})
+
+    with pytest.raises(ConnectionError):
+        fetch_all_league_players(query)
+    assert query.fallback_kwargs is None
+
+
+def test_unexpected_payload_falls_back_to_yfpy():
+    query = PoolQuery(payload={"fantasy_content": {}})
+
+    assert fetch_all_league_players(query) == []
+    assert query.fallback_kwargs == {}